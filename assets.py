@@ -0,0 +1,56 @@
+# assets.py
+
+import pygame
+
+class AssetCache:
+    """
+    フォントや事前描画したSurfaceなど、生成コストの高いアセットを共有するキャッシュ
+    シーンの再入場やラウンドのリスタートで同じアセットを作り直さないようにする
+    """
+
+    # システムに存在する等幅フォントの候補
+    MONO_FONT_NAMES = ('consolas', 'dejavusansmono', 'couriernew', 'monospace')
+
+    def __init__(self, prepare_surface):
+        """
+        AssetCacheオブジェクトの初期化
+        :param prepare_surface: キャッシュするSurfaceを描画バックエンド向けに変換する関数
+        """
+        self.prepare_surface = prepare_surface
+        self._assets = {} # キー -> アセット
+
+    def get(self, key, factory):
+        """
+        キーに対応するアセットを返す。未生成ならfactoryで生成して保存する。
+        :param key: アセットを識別するハッシュ可能なキー
+        :param factory: 引数なしでアセットを生成する関数
+        :return: キャッシュされたアセット
+        """
+        asset = self._assets.get(key)
+        if asset is None:
+            asset = factory()
+            self._assets[key] = asset
+        return asset
+
+    def surface(self, key, factory):
+        """
+        キーに対応するSurfaceを返す。未生成なら生成し、描画バックエンド向けに変換して保存する。
+        （surfaceバックエンドでは画面のピクセルフォーマットに変換される）
+        :param key: Surfaceを識別するハッシュ可能なキー
+        :param factory: 引数なしでSurfaceを生成する関数
+        :return: 変換済みのSurface
+        """
+        return self.get(key, lambda: self.prepare_surface(factory()))
+
+    def font(self, size, names=MONO_FONT_NAMES):
+        """
+        フォントを返す（SysFontの検索は初回のみ）
+        :param size: フォントサイズ
+        :param names: フォント名の候補
+        """
+        names = tuple(names)
+        return self.get(('font', names, size), lambda: pygame.font.SysFont(list(names), size))
+
+    def clear(self):
+        """キャッシュを全て破棄する"""
+        self._assets.clear()
@@ -0,0 +1,81 @@
+# bench/alloc_bench.py
+#
+# フレームごとのメモリ割り当てのベンチマーク（画面なしで全速力で回す）
+#   python -m bench.alloc_bench --scene play --frames 3000
+#   python -m bench.alloc_bench --scene arena --json alloc.json
+# 定常状態での1フレームあたりの割り当て・増加量がしきい値を超えたら終了コード1で失敗する
+
+import argparse
+import os
+import sys
+
+from capture.frame_capture import positive_int
+
+def run(scene, frames, tracker, renderer='surface'):
+    """
+    指定したシーンを frames フレーム進める（フレームレートの制御はしない）
+    :param scene: シーン名 ('play' or 'arena')
+    :param frames: フレーム数
+    :param tracker: AllocationTracker
+    :param renderer: 描画バックエンド名
+    """
+    import pygame
+    from game import Game
+
+    game = Game(renderer, 0, alloc_tracker=tracker)
+    game.scenes.change(scene)
+    for _ in range(frames):
+        tracker.begin_frame()
+        game._handle_events_()
+        game._update_()
+        game._draw_()
+        tracker.end_frame(game.scenes.current.live_entities())
+    game.scenes.current.exit()
+    pygame.quit()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="フレームごとのメモリ割り当てのベンチマーク")
+    parser.add_argument('--scene', choices=('play', 'arena'), default='play')
+    parser.add_argument('--frames', type=int, default=3000, help="計測するフレーム数（ウォームアップを含む）")
+    parser.add_argument('--warmup', type=int, default=600, help="集計に含めない最初のフレーム数")
+    parser.add_argument('--every', type=positive_int, default=60, help="何フレームごとにスナップショットを取るか")
+    parser.add_argument('--top', type=int, default=15, help="表示する関数の数")
+    parser.add_argument('--renderer', choices=('surface', 'sdl2'), default='surface')
+    parser.add_argument('--json', metavar='PATH', help="集計結果をJSONで書き出す")
+    parser.add_argument('--max-blocks-per-frame', type=float, default=None,
+                        help="1フレームあたりの割り当てブロック数の上限 (既定: シーンごとの値)")
+    parser.add_argument('--max-growth-per-frame', type=float, default=256.0,
+                        help="定常状態での1フレームあたりのメモリ増加量[byte]の上限 (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    # 画面なしで実行する
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    from diagnostics.allocations import AllocationTracker
+
+    tracker = AllocationTracker(every=args.every, warmup=args.warmup, top=args.top, json_path=args.json)
+    run(args.scene, args.frames, tracker, args.renderer)
+    print(tracker.report())
+    tracker.close()
+
+    max_blocks = args.max_blocks_per_frame
+    if max_blocks is None:
+        max_blocks = MAX_BLOCKS_PER_FRAME[args.scene]
+    _, blocks = tracker.allocations_per_frame()
+    growth, _ = tracker.growth_per_frame()
+    failures = []
+    if blocks > max_blocks:
+        failures.append(f"allocations {blocks:.1f} blocks/frame > {max_blocks}")
+    if growth > args.max_growth_per_frame:
+        failures.append(f"growth {growth:+.1f}B/frame > {args.max_growth_per_frame}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+# シーンごとの1フレームあたりの割り当てブロック数の上限
+# （計測値 play: 約240、arena: 約21000。arena は画面にかかる光線の折れ線の座標リストがほとんど）
+MAX_BLOCKS_PER_FRAME = {'play': 400, 'arena': 28000}
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# bench/collision_check.py
+#
+# 連続的な衝突判定（mode/play/collision.py）が、ティックを分割しない場合（steps=1）に
+# 変更前のティック終了時の判定と一致することを確かめる（画面なしで全速力で回す）
+#   python -m bench.collision_check
+#   python -m bench.collision_check --seeds 5 --ticks 5000
+# シードを固定したプレイのラウンドを進め、毎ティックの衝突判定の直前に、すべての光線について
+# check_beam(..., steps=1) と変更前の判定を比べる。1組でも食い違えば終了コード1で失敗する
+
+import argparse
+import math
+import os
+import random
+import sys
+
+def end_of_tick_check(planet, beam):
+    """
+    変更前の Play.check_collisions の判定（ティック終了時の位置だけを見る）
+    :return: (衝突したか, 帯の中にいるか)
+    """
+    beam_front_radius = beam.radius + beam.width + planet.size
+    beam_back_radius = max(0, beam.radius - beam.width - planet.size)
+    if not beam_back_radius < planet.radius < beam_front_radius:
+        return False, False
+    if planet.radius > planet.size:
+        angle_margin = math.asin(planet.size / planet.radius)
+    else:
+        angle_margin = math.pi
+    angle_diff = (planet.angle + beam.angle + math.pi) % (2 * math.pi) - math.pi
+    return abs(angle_diff) < beam.arc_range / 2 + angle_margin, True
+
+def run(seeds, ticks, first_seed=0, max_report=10):
+    """
+    シードごとにラウンドを ticks ティック進め、光線ごとの判定を比べる
+    :param seeds: ラウンドの数
+    :param ticks: 1ラウンドのティック数
+    :param first_seed: 最初のラウンドの乱数シード（以降は1ずつ増やす）
+    :param max_report: 記録する食い違いの数の上限
+    :return: (比べた組の数, 衝突の数, 食い違いの数, 食い違いの記録のリスト)
+    """
+    import pygame
+    from game import Game
+    from mode.play.collision import angle_margin, check_beam
+
+    game = Game('surface', 0)
+    play = game.scenes.scenes['play']
+    check_collisions = play.check_collisions
+    stats = {'pairs': 0, 'hits': 0, 'mismatches': 0}
+    mismatches = []
+
+    def compare_then_check(seed):
+        def compare():
+            planet = play.planet
+            margin = angle_margin(planet.radius, planet.size)
+            for beam in play.star.beams:
+                swept = check_beam(planet, beam, margin, steps=1)
+                expected = end_of_tick_check(planet, beam)
+                stats['pairs'] += 1
+                stats['hits'] += expected[0]
+                if swept != expected:
+                    stats['mismatches'] += 1
+                    if len(mismatches) < max_report:
+                        mismatches.append((seed, play.tick, beam.id, beam.radius, planet.angle, swept, expected))
+            check_collisions()
+        return compare
+
+    for seed in range(first_seed, first_seed + seeds):
+        play.initialize_play_state(seed)
+        play.check_collisions = compare_then_check(seed)
+        # 入力は恒星のAIとは別の乱数で、ランダムな長さだけ同じ方向を押し続ける
+        controls = random.Random(seed)
+        direction = 0
+        for _ in range(ticks):
+            if controls.random() < 0.05:
+                direction = controls.choice((-1, 0, 1))
+            play.step(direction)
+    play.check_collisions = check_collisions
+    pygame.quit()
+    return stats['pairs'], stats['hits'], stats['mismatches'], mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="連続的な衝突判定と変更前の判定の一致の確認")
+    parser.add_argument('--seeds', type=int, default=20, help="ラウンドの数")
+    parser.add_argument('--ticks', type=int, default=20000, help="1ラウンドのティック数")
+    parser.add_argument('--first-seed', type=int, default=0, help="最初のラウンドの乱数シード")
+    args = parser.parse_args(argv)
+
+    # 画面なしで実行する
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    pairs, hits, count, mismatches = run(args.seeds, args.ticks, args.first_seed)
+    print(f"collision check: seeds={args.seeds} ticks={args.ticks} pairs={pairs} hits={hits} mismatches={count}")
+    for seed, tick, beam_id, radius, planet_angle, swept, expected in mismatches:
+        print(f"  seed={seed} tick={tick} beam={beam_id} radius={radius:.3f} planet_angle={planet_angle:.6f} "
+              f"swept={swept} end_of_tick={expected}")
+    if count:
+        print(f"FAIL: {count} beam/planet pairs differ from the end-of-tick check")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
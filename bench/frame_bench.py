@@ -0,0 +1,94 @@
+# bench/frame_bench.py
+#
+# 1フレームの処理時間のベンチマーク（画面なしで全速力で回す）
+#   python -m bench.frame_bench --scene arena
+#   python -m bench.frame_bench --scene arena --renderer sdl2
+# ウォームアップ後、frames フレームずつ repeat 回計測し、計測した全フレームの95パーセンタイルが
+# 予算（既定: 1/FPS 秒）を超えたら終了コード1で失敗する（平均が予算内でも、予算を超えたフレームは
+# 表示が1回分遅れるため、FPSを保てているかは時間のかかったフレームの側で判定する）
+
+import argparse
+import os
+import sys
+import time
+
+PHASES = ('events', 'update', 'draw', 'frame')
+
+def run(scene, frames, warmup, renderer='surface', repeat=1):
+    """
+    指定したシーンを warmup + frames * repeat フレーム進め、ウォームアップ後の各段階の時間を計測する
+    :param scene: シーン名 ('play' or 'arena')
+    :param frames: 1回に計測するフレーム数
+    :param warmup: 計測しない最初のフレーム数（光線の数が定常状態になるまで）
+    :param renderer: 描画バックエンド名
+    :param repeat: 計測する回数（続けて frames フレームずつ）
+    :return: (回ごとの 段階 -> 時間[ms]のリスト, 最後のフレームで生きているエンティティの数)
+    """
+    import pygame
+    from game import Game
+
+    game = Game(renderer, 0)
+    game.scenes.change(scene)
+    runs = [{phase: [] for phase in PHASES} for _ in range(repeat)]
+    perf_counter = time.perf_counter
+    for frame in range(warmup + frames * repeat):
+        start = perf_counter()
+        game._handle_events_()
+        events_done = perf_counter()
+        game._update_()
+        update_done = perf_counter()
+        game._draw_()
+        draw_done = perf_counter()
+        if frame >= warmup:
+            times = runs[(frame - warmup) // frames]
+            times['events'].append((events_done - start) * 1000)
+            times['update'].append((update_done - events_done) * 1000)
+            times['draw'].append((draw_done - update_done) * 1000)
+            times['frame'].append((draw_done - start) * 1000)
+    live_entities = game.scenes.current.live_entities()
+    game.scenes.current.exit()
+    pygame.quit()
+    return runs, live_entities
+
+def summarize(samples):
+    """時間のリストから (平均, 中央値, 95パーセンタイル, 最大) を求める"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return (sum(ordered) / count, ordered[count // 2], ordered[min(count - 1, count * 95 // 100)], ordered[-1])
+
+def main(argv=None):
+    # 画面なしで実行する
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    from config import FPS
+
+    parser = argparse.ArgumentParser(description="1フレームの処理時間のベンチマーク")
+    parser.add_argument('--scene', choices=('play', 'arena'), default='arena')
+    parser.add_argument('--frames', type=int, default=600, help="1回に計測するフレーム数")
+    parser.add_argument('--repeat', type=int, default=3, help="計測する回数")
+    parser.add_argument('--warmup', type=int, default=900, help="計測しない最初のフレーム数")
+    parser.add_argument('--renderer', choices=('surface', 'sdl2'), default='surface')
+    parser.add_argument('--budget-ms', type=float, default=1000 / FPS,
+                        help="1フレームの時間の95パーセンタイル[ms]の上限 (default: %(default).2f)")
+    args = parser.parse_args(argv)
+
+    runs, live_entities = run(args.scene, args.frames, args.warmup, args.renderer, args.repeat)
+    print(f"frame time: scene={args.scene} renderer={args.renderer} frames={args.frames}x{args.repeat} "
+          f"budget={args.budget_ms:.2f}ms")
+    print("  live entities: " + (", ".join(f"{name}={count}" for name, count in live_entities.items()) or "-"))
+    for index, times in enumerate(runs):
+        print(f"  run {index + 1}:")
+        for phase in PHASES:
+            avg, p50, p95, worst = summarize(times[phase])
+            print(f"    {phase:<6} avg={avg:7.3f}ms p50={p50:7.3f}ms p95={p95:7.3f}ms max={worst:7.3f}ms")
+
+    avg, p50, p95, worst = summarize([sample for times in runs for sample in times['frame']])
+    print(f"  all runs: frame avg={avg:7.3f}ms p50={p50:7.3f}ms p95={p95:7.3f}ms max={worst:7.3f}ms")
+    if p95 > args.budget_ms:
+        print(f"FAIL: frame p95 {p95:.3f}ms > {args.budget_ms:.2f}ms")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# capture/frame_capture.py
+
+import argparse
+import multiprocessing
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from capture.writers import create_writer, unpack_rgb
+
+# 書き出しが追いつかないときの方針
+#   drop_newest: リングバッファが埋まっていたら新しいフレームを捨てる（ゲームスレッドは待たない）
+#   drop_oldest: 書き出し側が溜まった古いフレームを飛ばして最新のフレームから書き出す（ゲームスレッドは待たない）
+#   block: 空きが出るまで待つ（オフラインのリプレイ描画用）
+POLICIES = ('drop_newest', 'drop_oldest', 'block')
+
+WRITER_POLL_SECONDS = 1.0 # block で空きを待つあいだ、書き出しプロセスが生きているかを確かめる間隔[s]
+
+def positive_int(text):
+    """
+    コマンドライン引数のフレームの間隔（何フレームごとに1回か）を1以上の整数として解析する（argparse の type 用）
+    間隔は割り算や剰余に使う（録画の再生フレームレート FPS // every、メモリ計測のサンプリングなど）ので、0や負の値はここで弾く
+    :param text: 引数の文字列
+    :return: 1以上の整数
+    """
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {text!r}")
+    return value
+
+def _writer_main(shm_name, shape, ring_size, fmt, out_dir, size, fps, policy, pending, free):
+    """
+    書き出しプロセスの本体
+    PNGの圧縮などはGILを長く握るため、ゲームと別プロセスで行う
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((ring_size,) + shape, dtype=np.uint32, buffer=shm.buf)
+    writer = create_writer(fmt, out_dir, size, fps)
+    try:
+        while True:
+            message = pending.get()
+            if message is None:
+                break
+            if policy == 'drop_oldest':
+                # 溜まっているフレームは最新のものだけを書き出し、残りは捨てて返却する
+                while True:
+                    try:
+                        newer = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if newer is None:
+                        pending.put(None)
+                        break
+                    free.put((message[0], False))
+                    message = newer
+
+            slot, frame_index, shifts = message
+            writer.write(frame_index, unpack_rgb(slots[slot], shifts))
+            free.put((slot, True))
+    finally:
+        writer.close()
+        del slots
+        shm.close()
+
+class FrameCapture:
+    """
+    画面を事前確保したリングバッファ（共有メモリ）にコピーし、別プロセスでファイルに書き出すクラス
+    ゲームスレッドで行うのはピクセルのコピーだけで、変換・圧縮・書き込みはすべて書き出しプロセスで行う
+    """
+
+    def __init__(self, out_dir, size, fmt='png', every=1, ring_size=8, policy='drop_newest', fps=60):
+        """
+        FrameCaptureオブジェクトの初期化
+        :param out_dir: 出力先ディレクトリ
+        :param size: 画面サイズ (幅, 高さ)
+        :param fmt: 出力形式 ('png' or 'y4m')
+        :param every: 何フレームごとに1枚キャプチャするか（間引き）
+        :param ring_size: リングバッファのフレーム数
+        :param policy: 書き出しが追いつかないときの方針 (POLICIES)
+        :param fps: 出力の再生フレームレート
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"unknown capture policy: {policy!r} (choose from {', '.join(POLICIES)})")
+        self.out_dir = out_dir
+        self.size = size
+        self.every = max(1, every)
+        self.policy = policy
+
+        # --- リングバッファ ---
+        # (高さ, 幅) で確保し、転置ビューにコピーすると surfarray のメモリ配置と一致して連続コピーになる
+        width, height = size
+        shape = (height, width)
+        self._shm = shared_memory.SharedMemory(create=True, size=ring_size * height * width * 4)
+        self._slots = np.ndarray((ring_size,) + shape, dtype=np.uint32, buffer=self._shm.buf)
+        self._slots.fill(0) # ページを確保しておき、最初のコピーでページフォールトが起きないようにする
+        self._free_slots = deque(range(ring_size)) # ゲーム側で把握している空きスロット
+
+        # --- 書き出しプロセス ---
+        context = multiprocessing.get_context('spawn')
+        self._pending = context.Queue() # 書き出し待ちの (スロット, フレーム番号, シフト量)
+        self._free = context.Queue() # 書き出しが終わった (スロット, 書き出したか)
+        self._process = context.Process(
+            target=_writer_main, name="frame-capture", daemon=True,
+            args=(self._shm.name, shape, ring_size, fmt, out_dir, size, fps, policy, self._pending, self._free))
+        self._process.start()
+        self._shifts = None
+
+        # --- 統計 ---
+        self.frame_index = 0 # grab() が呼ばれた回数
+        self.captured = 0 # リングバッファに入れたフレーム数
+        self.dropped = 0 # 捨てたフレーム数
+        self.written = 0 # 書き出したフレーム数
+        self.max_grab_ms = 0.0 # ゲームスレッドでの最大処理時間（捨てたフレームも含む）
+        self.total_grab_ms = 0.0 # リングバッファに入れたフレームの処理時間の合計（平均は captured で割る）
+
+    def grab(self, surface):
+        """
+        画面をリングバッファにコピーする（ゲームスレッドから毎フレーム呼ぶ）
+        :param surface: 描画済みの32bitのSurface
+        """
+        frame_index = self.frame_index
+        self.frame_index += 1
+        if frame_index % self.every != 0:
+            return
+        start = time.perf_counter()
+
+        slot = self._acquire_slot()
+        if slot is None:
+            self.dropped += 1
+        else:
+            if self._shifts is None:
+                self._shifts = surface.get_shifts()
+            view = pygame.surfarray.pixels2d(surface)
+            np.copyto(self._slots[slot].T, view)
+            del view # Surfaceのロックを解除する
+            self._pending.put((slot, frame_index, self._shifts))
+            self.captured += 1
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if slot is not None:
+            self.total_grab_ms += elapsed_ms
+        self.max_grab_ms = max(self.max_grab_ms, elapsed_ms)
+
+    def _acquire_slot(self):
+        """方針に従って空きスロットを確保する。確保できなければNone"""
+        self._collect_free_slots()
+        while not self._free_slots and self.policy == 'block':
+            try:
+                self._release(*self._free.get(timeout=WRITER_POLL_SECONDS))
+            except queue.Empty:
+                # 書き出しプロセスが異常終了していたら、スロットは二度と返ってこない
+                if not self._process.is_alive():
+                    raise RuntimeError(f"frame writer process exited (exit code {self._process.exitcode})")
+        if self._free_slots:
+            return self._free_slots.popleft()
+        return None
+
+    def _collect_free_slots(self):
+        """書き出しプロセスから返却されたスロットを回収する"""
+        while True:
+            try:
+                self._release(*self._free.get_nowait())
+            except queue.Empty:
+                return
+
+    def _release(self, slot, written):
+        """返却されたスロットを空きに戻す"""
+        self._free_slots.append(slot)
+        if written:
+            self.written += 1
+        else:
+            self.dropped += 1
+
+    def close(self):
+        """残りのフレームを書き出してから書き出しプロセスを終了する"""
+        self._pending.put(None)
+        self._process.join()
+        self._collect_free_slots()
+        del self._slots
+        self._shm.close()
+        self._shm.unlink()
+
+    def report(self):
+        """
+        キャプチャの統計を文字列で返す
+        """
+        captured = max(1, self.captured)
+        return (f"capture: frames={self.frame_index} captured={self.captured} written={self.written} "
+                f"dropped={self.dropped} grab avg={self.total_grab_ms / captured:.3f}ms max={self.max_grab_ms:.3f}ms")
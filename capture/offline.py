@@ -0,0 +1,60 @@
+# capture/offline.py
+# リプレイログからラウンドを再現し、実時間に縛られず全速力でフレームを書き出す
+#   python -m capture.offline replay_0000.json out_dir --format y4m
+
+import argparse
+import os
+import sys
+
+# 画面を開かずに描画する（環境変数で明示されていればそれに従う）
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from capture.frame_capture import FrameCapture, positive_int
+from capture.replay import ReplayLog
+from capture.writers import FORMATS
+
+def render_replay(log_path, out_dir, fmt='png', every=1):
+    """
+    リプレイログを再生して全フレームを書き出す
+    :param log_path: リプレイログのパス
+    :param out_dir: 出力先ディレクトリ
+    :param fmt: 出力形式 ('png' or 'y4m')
+    :param every: 何フレームごとに1枚書き出すか
+    :return: 使用したFrameCapture（統計の参照用）
+    """
+    from game import Game
+
+    log = ReplayLog.load(log_path)
+    # オフライン描画ではフレームを捨てず、書き出しを待つ
+    capture = FrameCapture(out_dir, (SCREEN_WIDTH, SCREEN_HEIGHT), fmt, every, policy='block', fps=FPS // every)
+    game = Game('surface')
+    game.capture = capture
+
+    play = game.scenes.scenes['play']
+    play.use_tick_clock = True
+    game.scenes.change('play')
+    play.initialize_play_state(seed=log.seed)
+
+    for direction in log.directions:
+        play.left_active = direction > 0
+        play.right_active = direction < 0
+        play.step(direction)
+        game._draw_()
+
+    capture.close()
+    return capture
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="リプレイログからフレームを書き出す")
+    parser.add_argument('replay', help="リプレイログ (replay_XXXX.json)")
+    parser.add_argument('out_dir', help="出力先ディレクトリ")
+    parser.add_argument('--format', choices=FORMATS, default='png')
+    parser.add_argument('--every', type=positive_int, default=1, help="何フレームごとに1枚書き出すか")
+    args = parser.parse_args(argv)
+
+    capture = render_replay(args.replay, args.out_dir, args.format, args.every)
+    print(capture.report())
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# capture/replay.py
+
+import json
+import random
+
+class ReplayLog:
+    """
+    1ラウンド分のリプレイログ
+    乱数のシードと毎ティックの入力方向を記録すれば、同じラウンドを再現できる
+    """
+
+    VERSION = 1
+
+    def __init__(self, seed=None, directions=None):
+        """
+        :param seed: ラウンド開始時に設定する乱数シード（Noneなら新しく生成）
+        :param directions: 毎ティックの入力方向のリスト (-1.0 ~ 1.0。ティックの途中で離した場合は押していた時間の割合)
+        """
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.directions = [] if directions is None else directions
+
+    def record(self, direction):
+        """1ティック分の入力方向を記録する"""
+        self.directions.append(direction)
+
+    def save(self, path):
+        """JSONファイルに保存する"""
+        with open(path, 'w') as f:
+            json.dump({'version': self.VERSION, 'seed': self.seed, 'directions': self.directions}, f)
+
+    @classmethod
+    def load(cls, path):
+        """JSONファイルから読み込む"""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['seed'], data['directions'])
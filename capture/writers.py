@@ -0,0 +1,98 @@
+# capture/writers.py
+
+import os
+
+import numpy as np
+import pygame
+
+# 出力できる形式
+FORMATS = ('png', 'y4m')
+
+def unpack_rgb(pixels, shifts):
+    """
+    32bitのピクセル配列をRGBの配列に展開する
+    :param pixels: (高さ, 幅) の uint32 配列
+    :param shifts: 画面のピクセルフォーマットの (R, G, B, A) シフト量
+    :return: (高さ, 幅, 3) の uint8 配列
+    """
+    rgb = np.empty(pixels.shape + (3,), dtype=np.uint8)
+    for channel in range(3):
+        rgb[..., channel] = (pixels >> shifts[channel]) & 0xFF
+    return rgb
+
+class PngSequenceWriter:
+    """
+    フレームを連番のPNGファイルとして書き出すクラス
+    """
+
+    def __init__(self, out_dir, size, fps):
+        """
+        :param out_dir: 出力先ディレクトリ
+        :param size: フレームサイズ (幅, 高さ)
+        :param fps: 再生時のフレームレート（PNGでは使用しない）
+        """
+        self.out_dir = out_dir
+        self.size = size
+        os.makedirs(out_dir, exist_ok=True)
+
+    def write(self, frame_index, rgb):
+        """
+        1フレームを書き出す
+        :param frame_index: ゲーム開始からのフレーム番号
+        :param rgb: (高さ, 幅, 3) の uint8 配列
+        """
+        image = pygame.image.frombuffer(rgb.tobytes(), self.size, 'RGB')
+        pygame.image.save(image, os.path.join(self.out_dir, f"frame_{frame_index:07d}.png"))
+
+    def close(self):
+        pass
+
+class Y4mWriter:
+    """
+    フレームを1本のY4M（YUV4MPEG2, 4:2:0）ストリームとして書き出すクラス
+    ffmpeg などでそのまま動画に変換できる
+    """
+
+    def __init__(self, out_dir, size, fps):
+        """
+        :param out_dir: 出力先ディレクトリ
+        :param size: フレームサイズ (幅, 高さ)。4:2:0のため偶数であること
+        :param fps: 再生時のフレームレート
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        width, height = size
+        self.file = open(os.path.join(out_dir, "capture.y4m"), 'wb')
+        self.file.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C420jpeg\n".encode('ascii'))
+
+    def write(self, frame_index, rgb):
+        """
+        1フレームを書き出す（BT.601 フルレンジで変換）
+        :param frame_index: ゲーム開始からのフレーム番号
+        :param rgb: (高さ, 幅, 3) の uint8 配列
+        """
+        rgb = rgb.astype(np.float32)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        y = 0.299 * r + 0.587 * g + 0.114 * b
+        u = (b - y) * 0.564 + 128
+        v = (r - y) * 0.713 + 128
+        # 色差は2x2画素の平均で間引く
+        u = u.reshape(u.shape[0] // 2, 2, u.shape[1] // 2, 2).mean(axis=(1, 3))
+        v = v.reshape(v.shape[0] // 2, 2, v.shape[1] // 2, 2).mean(axis=(1, 3))
+
+        self.file.write(b"FRAME\n")
+        for plane in (y, u, v):
+            self.file.write(np.clip(plane + 0.5, 0, 255).astype(np.uint8).tobytes())
+
+    def close(self):
+        self.file.close()
+
+def create_writer(fmt, out_dir, size, fps):
+    """
+    形式名から書き出しクラスを生成する
+    :param fmt: 'png' or 'y4m'
+    """
+    if fmt == 'png':
+        return PngSequenceWriter(out_dir, size, fps)
+    if fmt == 'y4m':
+        return Y4mWriter(out_dir, size, fps)
+    raise ValueError(f"unknown capture format: {fmt!r} (choose from {', '.join(FORMATS)})")
@@ -17,8 +17,18 @@ EARTH_BLUE = (51, 153, 204)
 SUN_ORANGE = (252, 130, 0)
 # フレームレート
 FPS = 120
+# シミュレーションのティックレート（FPSを割り切れる値）。下げるとティック数が減る（ヘッドレス実行・早送り用）
+TICK_RATE = FPS
+# 1ティックで進めるフレーム数（速度などのパラメータは1フレーム(1/FPS秒)あたりの値）
+TICK_STEPS = FPS // TICK_RATE
+# フレームの待ち時間のあいだに入力イベントを取り出す間隔[s]（入力の時刻の精度）
+INPUT_POLL_INTERVAL = 0.001
 NUM_BACKGROUND_STARS = 250
 BUTTON_RADIUS = 30
+# 描画バックエンド ('surface': pygame.displayへのソフトウェア描画, 'sdl2': SDL2のRenderer/Texture)
+RENDER_BACKEND = 'surface'
+# sdl2バックエンドのレンダラ (-1: 自動, 0: ソフトウェアレンダラ, 1: ハードウェアレンダラ)
+RENDER_ACCELERATED = -1
 
 # --- ゲームプレイに関連するパラメータ ---
 
@@ -39,4 +49,13 @@ PLANET_INITIAL_ANGLE = math.pi / 2  # 惑星の初期角度（90度、下方向
 # Starに関するパラメータ
 STAR_SIZE = PLANET_SIZE*3 # 恒星の直径
 STAR_ACCELERATION = 0.0010 # 恒星の角加速度
-STAR_FRICTION = 0.99 # 恒星の減速率
\ No newline at end of file
+STAR_FRICTION = 0.99 # 恒星の減速率
+
+# Arena（多数の恒星と惑星が登場するモード）に関するパラメータ
+ARENA_NUM_STARS = 32 # 恒星の数
+ARENA_STAR_SIZE = 24 # 恒星の直径
+ARENA_PLANET_ORBITS = (120, 180, 240, 300) # 惑星の公転半径（CENTER_POS を中心に1つずつ配置）
+ARENA_FIRE_PROBABILITY = 0.75 # 各砲台が発射する確率
+ARENA_BEAM_MAX_RADIUS = SCREEN_WIDTH # 光線の最大半径（画面の端にいる恒星の光線も画面を横切る）
+ARENA_RING_WIDTH = 64 # 衝突判定の空間分割：リング（恒星からの距離）の幅
+ARENA_SECTORS = 32 # 衝突判定の空間分割：角度の分割数
@@ -0,0 +1,326 @@
+# diagnostics/allocations.py
+#
+# tracemalloc を使ったフレームごとのメモリ割り当ての計測（オプトイン。計測中はゲームが数倍遅くなる）
+#   - N フレームに1回、フレーム内で確保されたものを割り当てた関数ごとに集計する
+#   - N フレームごとのスナップショットの差分（生きているメモリの増減）を関数ごとに集計する
+#   - フレーム内で一時的に確保されたメモリの最大量（tracemalloc のピーク）を記録する
+#   - プロセスの最大RSSと、生きているエンティティの数を記録する
+# ウォームアップ後の差分を「定常状態での1フレームあたりの増加量」とし、少しずつ増え続けるメモリの発生源を探す
+
+import ast
+import json
+import os
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+# 計測対象のソースツリー（このパッケージの1つ上）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Game のメインループで、割り当てがどの段階で行われたかを判定する関数名
+PHASES = {'_handle_events_': 'events', '_update_': 'update', '_draw_': 'draw'}
+
+class _FunctionIndex:
+    """ソースファイルの行番号から、それを含む関数の修飾名（Beam.draw など）を引く"""
+
+    def __init__(self):
+        self._files = {} # ファイル名 -> [(開始行, 終了行, 修飾名), ...]
+
+    def _load(self, filename):
+        functions = []
+        try:
+            with open(filename, encoding='utf-8') as f:
+                tree = ast.parse(f.read(), filename)
+        except (OSError, SyntaxError, ValueError):
+            return functions
+
+        def visit(node, prefix):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    name = prefix + child.name
+                    if not isinstance(child, ast.ClassDef):
+                        functions.append((child.lineno, child.end_lineno, name))
+                    visit(child, name + '.')
+        visit(tree, '')
+        return functions
+
+    def lookup(self, filename, lineno):
+        """
+        行を含むもっとも内側の関数名を返す
+        :return: 修飾名。関数の外ならモジュール名
+        """
+        functions = self._files.get(filename)
+        if functions is None:
+            functions = self._files[filename] = self._load(filename)
+        best = None
+        for start, end, name in functions:
+            if start <= lineno <= end and (best is None or start >= best[0]):
+                best = (start, name)
+        if best is not None:
+            return best[1]
+        return os.path.splitext(os.path.basename(filename))[0]
+
+class AllocationTracker:
+    """
+    フレームごとのメモリ割り当てを計測するクラス
+    Game のメインループから begin_frame()、描画命令の書き出し直前に checkpoint()、最後に end_frame() を毎フレーム呼ぶ。
+    - 割り当て: every フレームに1回、begin_frame() と checkpoint() でスナップショットを取り、その間に確保されて
+      まだ生きているもの（色のタプル、Rect、描画命令、作り直したリストなど）を関数ごとに数える
+    - 増加: every フレームごとのスナップショットの差分（生きているメモリの増減）を関数ごとに足し合わせる
+    """
+
+    def __init__(self, every=60, warmup=120, top=15, nframes=25, json_path=None):
+        """
+        AllocationTrackerオブジェクトの初期化
+        :param every: 何フレームごとにスナップショットを取って集計するか
+        :param warmup: 集計に含めない最初のフレーム数（キャッシュの生成などを除く）
+        :param top: report() に表示する関数の数
+        :param nframes: 割り当てごとに記録するスタックの深さ
+        :param json_path: 指定した場合は close() で集計結果をJSONに書き出す
+        """
+        if every < 1:
+            raise ValueError(f"allocation sampling interval must be a positive integer: {every!r}")
+        self.every = every
+        self.warmup = warmup
+        self.top = top
+        self.nframes = nframes
+        self.json_path = json_path
+
+        self._index = _FunctionIndex()
+        # 計測側（このファイルと tracemalloc 自身）と import の割り当ては集計しない
+        # （Snapshot.filter_traces はすべてのトレースのすべてのフレームを照合して遅いので、差分だけを調べる）
+        self._ignored_files = {__file__, tracemalloc.__file__,
+                               '<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>'}
+
+        self.frame = 0
+        self._frame_start = 0
+        self._sampling = False # このフレームでスナップショットを取っているか
+
+        # フレーム内の割り当て（サンプルしたフレームの平均）
+        self.sampled_frames = 0
+        self.alloc_bytes = 0
+        self.alloc_blocks = 0
+        self.alloc_sites = {} # (段階, 関数, 場所) -> [byte, ブロック数]
+        # フレーム内で一時的に確保されたメモリの最大量（スナップショットを取らないフレームのみ）
+        self.transient_frames = 0
+        self.transient_total = 0
+        self.transient_max = 0
+        # 定常状態での生きているメモリの増減
+        self.measured_frames = 0
+        self.growth_bytes = 0
+        self.growth_blocks = 0
+        self.growth_sites = {}
+
+        self.live_entities = {}
+        self.max_live_entities = {}
+
+        self._frame_snapshot = None
+        self._growth_snapshot = None
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot()
+
+    def _differences(self, snapshot, previous):
+        """2つのスナップショットの差分のうち、計測側の割り当てを除いたもの"""
+        for stat in snapshot.compare_to(previous, 'traceback'):
+            if any(frame.filename in self._ignored_files for frame in stat.traceback):
+                continue
+            yield stat
+
+    def begin_frame(self):
+        """フレームの開始時に呼ぶ"""
+        if not tracemalloc.is_tracing():
+            # 起動時の import などは追わない（スタックが深く、計測すると非常に遅い）
+            tracemalloc.start(self.nframes)
+        measured = self.frame - self.warmup
+        self._sampling = measured >= 0 and measured % self.every == 0
+        if self._sampling:
+            self._frame_snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+        self._frame_start = tracemalloc.get_traced_memory()[0]
+
+    def checkpoint(self):
+        """
+        更新と描画の予約が終わり、描画命令を書き出す直前に呼ぶ
+        サンプルするフレームでは、begin_frame() からここまでに確保されて生きているものを集計する
+        """
+        if self._frame_snapshot is None:
+            return
+        differences = self._differences(self._take_snapshot(), self._frame_snapshot)
+        self._frame_snapshot = None
+        self.sampled_frames += 1
+        for stat in differences:
+            if stat.count_diff <= 0:
+                continue
+            self._add(self.alloc_sites, stat.traceback, stat.size_diff, stat.count_diff)
+            self.alloc_bytes += stat.size_diff
+            self.alloc_blocks += stat.count_diff
+
+    def end_frame(self, live_entities=None):
+        """
+        フレームの終了時に呼ぶ
+        :param live_entities: 生きているエンティティの数（種類 -> 数）
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        self.frame += 1
+
+        if live_entities:
+            self.live_entities = dict(live_entities)
+            for name, count in live_entities.items():
+                self.max_live_entities[name] = max(self.max_live_entities.get(name, 0), count)
+
+        if self.frame <= self.warmup:
+            if self.frame == self.warmup:
+                self._growth_snapshot = self._take_snapshot()
+            return
+
+        if not self._sampling:
+            # スナップショット自体の割り当てがピークに入るので、サンプルしたフレームは除く
+            transient = peak - self._frame_start
+            self.transient_frames += 1
+            self.transient_total += transient
+            self.transient_max = max(self.transient_max, transient)
+
+        if (self.frame - self.warmup) % self.every == 0:
+            snapshot = self._take_snapshot()
+            for stat in self._differences(snapshot, self._growth_snapshot):
+                if stat.size_diff == 0 and stat.count_diff == 0:
+                    continue
+                self._add(self.growth_sites, stat.traceback, stat.size_diff, stat.count_diff)
+                self.growth_bytes += stat.size_diff
+                self.growth_blocks += stat.count_diff
+            self._growth_snapshot = snapshot
+            self.measured_frames += self.every
+
+    def _attribute(self, traceback):
+        """
+        割り当てのスタックから、計測対象のソースツリー内でもっとも内側の関数と、メインループの段階を求める
+        :return: (段階, 関数の修飾名, ファイル:行)
+        """
+        phase = 'other'
+        function = site = None
+        # tracemalloc の traceback は外側の呼び出しから順に並ぶので、内側から調べる
+        for frame in reversed(traceback):
+            filename = frame.filename
+            if not filename.startswith(PROJECT_ROOT):
+                continue
+            name = self._index.lookup(filename, frame.lineno)
+            if function is None:
+                function = name
+                site = f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.lineno}"
+            method = name.rsplit('.', 1)[-1]
+            if method in PHASES:
+                phase = PHASES[method]
+                break
+        if function is None:
+            # ライブラリの内部だけで完結した割り当て
+            frame = traceback[-1]
+            function = '<external>'
+            site = f"{frame.filename}:{frame.lineno}"
+        return phase, function, site
+
+    def _add(self, sites, traceback, size, count):
+        """関数ごとの集計に足す"""
+        totals = sites.setdefault(self._attribute(traceback), [0, 0])
+        totals[0] += size
+        totals[1] += count
+
+    def close(self):
+        """集計結果を（指定されていれば）JSONに書き出し、tracemalloc を停止する"""
+        if self.json_path is not None:
+            self.write_json(self.json_path)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # --- 集計結果 ---
+
+    @staticmethod
+    def peak_rss_kb():
+        """プロセスの最大RSS[KiB]（取得できなければNone）"""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS は byte、Linux は KiB
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+    def allocations_per_frame(self):
+        """1フレームあたりの割り当て (byte, ブロック数)"""
+        frames = max(1, self.sampled_frames)
+        return self.alloc_bytes / frames, self.alloc_blocks / frames
+
+    def growth_per_frame(self):
+        """定常状態での1フレームあたりのメモリ増加量 (byte, ブロック数)"""
+        frames = max(1, self.measured_frames)
+        return self.growth_bytes / frames, self.growth_blocks / frames
+
+    def _ranked(self, sites, frames, count):
+        """byte数の絶対値が大きい順に関数を並べる"""
+        frames = max(1, frames)
+        ranked = sorted(sites.items(), key=lambda item: abs(item[1][0]), reverse=True)
+        return [{'phase': phase, 'function': function, 'site': site,
+                 'bytes_per_frame': size / frames, 'blocks_per_frame': blocks / frames}
+                for (phase, function, site), (size, blocks) in ranked[:count]]
+
+    def summary(self):
+        """集計結果を辞書で返す（JSONに書き出せる形）"""
+        alloc_bytes, alloc_blocks = self.allocations_per_frame()
+        growth_bytes, growth_blocks = self.growth_per_frame()
+        return {
+            'frames': self.frame,
+            'allocations': {
+                'sampled_frames': self.sampled_frames,
+                'bytes_per_frame': alloc_bytes,
+                'blocks_per_frame': alloc_blocks,
+                'top': self._ranked(self.alloc_sites, self.sampled_frames, self.top),
+            },
+            'growth': {
+                'measured_frames': self.measured_frames,
+                'bytes_per_frame': growth_bytes,
+                'blocks_per_frame': growth_blocks,
+                'top': self._ranked(self.growth_sites, self.measured_frames, self.top),
+            },
+            'transient_bytes_per_frame': {
+                'avg': self.transient_total / self.transient_frames if self.transient_frames else 0.0,
+                'max': self.transient_max,
+            },
+            'traced_bytes': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+            'peak_rss_kb': self.peak_rss_kb(),
+            'live_entities': self.live_entities,
+            'max_live_entities': self.max_live_entities,
+        }
+
+    def write_json(self, path):
+        """集計結果をJSONファイルに書き出す"""
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def report(self):
+        """集計結果を文字列で返す"""
+        summary = self.summary()
+        allocations = summary['allocations']
+        growth = summary['growth']
+        transient = summary['transient_bytes_per_frame']
+        lines = [
+            f"allocations: frames={summary['frames']} peak_rss={summary['peak_rss_kb']}KiB "
+            f"transient avg={transient['avg']:.0f}B max={transient['max']}B",
+            "  live entities: " + (", ".join(f"{name}={count} (max {summary['max_live_entities'][name]})"
+                                             for name, count in summary['live_entities'].items()) or "-"),
+            f"  per frame: {allocations['bytes_per_frame']:.0f}B in {allocations['blocks_per_frame']:.1f} blocks "
+            f"(sampled {allocations['sampled_frames']} frames)",
+        ]
+        for row in allocations['top']:
+            lines.append(self._format_row(row))
+        lines.append(f"  growth: {growth['bytes_per_frame']:+.1f}B/frame ({growth['blocks_per_frame']:+.3f} blocks/frame) "
+                     f"over {growth['measured_frames']} frames")
+        for row in growth['top']:
+            lines.append(self._format_row(row))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_row(row):
+        return (f"    {row['bytes_per_frame']:+10.1f}B {row['blocks_per_frame']:+9.3f} blocks  "
+                f"[{row['phase']:<6}] {row['function']} ({row['site']})")
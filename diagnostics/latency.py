@@ -0,0 +1,55 @@
+# diagnostics/latency.py
+#
+# 入力から画面表示まで（input-to-photon）の遅延の計測
+#   入力イベントの時刻から、その入力を反映したティックのフレームを display.flip / present し終えるまでの時間
+
+import time
+
+class LatencyProbe:
+    """
+    入力イベントの時刻から、その入力を反映したフレームの表示が終わるまでの時間を計測するクラス
+    InputTimeline.latch() が反映したイベントの時刻を latched() で渡し、Game が present() の直後に presented() を呼ぶ
+    """
+
+    def __init__(self, max_samples=10000):
+        """
+        LatencyProbeオブジェクトの初期化
+        :param max_samples: 保持する遅延[ms]の数（古いものから捨てる）
+        """
+        self.max_samples = max_samples
+        self.samples = [] # 遅延[ms]
+        self._pending = [] # シミュレーションに反映され、まだ表示されていないイベントの時刻
+
+    def latched(self, timestamps):
+        """
+        シミュレーションに反映した入力イベントの時刻を登録する
+        :param timestamps: イベントの時刻[s]（time.perf_counter() の値）のリスト
+        """
+        self._pending.extend(timestamps)
+
+    def presented(self, now=None):
+        """
+        フレームの表示が終わったときに呼ぶ
+        :param now: 表示が終わった時刻[s]（Noneなら現在時刻）
+        """
+        if not self._pending:
+            return
+        now = time.perf_counter() if now is None else now
+        self.samples.extend((now - timestamp) * 1000 for timestamp in self._pending)
+        self._pending.clear()
+        if len(self.samples) > self.max_samples:
+            del self.samples[:len(self.samples) - self.max_samples]
+
+    def report(self):
+        """
+        遅延の集計を文字列で返す
+        :return: 回数・平均・中央値・95パーセンタイル・最大[ms]を並べた文字列
+        """
+        if not self.samples:
+            return "input-to-photon latency: no samples"
+        samples = sorted(self.samples)
+        count = len(samples)
+        p50 = samples[count // 2]
+        p95 = samples[min(count - 1, count * 95 // 100)]
+        return (f"input-to-photon latency: n={count:5d} avg={sum(samples) / count:7.3f}ms "
+                f"p50={p50:7.3f}ms p95={p95:7.3f}ms max={samples[-1]:7.3f}ms")
@@ -1,7 +1,5 @@
 # entities/base.py
 
-import pygame
-
 # --- 基底クラス ---
 
 class CelestialBody:
@@ -15,14 +13,16 @@ class CelestialBody:
         self.acceleration = acceleration # 天体の角加速度
         self.friction = friction # 天体の減速率
 
-    def update_angle_and_speed(self, direction):
+    def update_angle_and_speed(self, direction, steps=1):
         """
         物理法則（加速と摩擦）を適用して速度と角度を更新する。
         param direction: 加速度の方向（1: 正方向, -1: 負方向）
+        param steps: 進めるフレーム数（1ティックが複数フレームにあたる場合）
         """
-        self.speed += self.acceleration * direction # 加速度から速度を更新
-        self.speed *= self.friction # 減速率を適用
-        self.angle += self.speed # 速度から角度を更新
+        for _ in range(steps):
+            self.speed += self.acceleration * direction # 加速度から速度を更新
+            self.speed *= self.friction # 減速率を適用
+            self.angle += self.speed # 速度から角度を更新
 
 class BaseArc:
     """円弧を描画するオブジェクト（光線やその死体）の基底クラス。"""
@@ -42,10 +42,10 @@ class BaseArc:
         """生存しているか。サブクラスで実装。"""
         raise NotImplementedError
 
-    def draw_arc(self, screen, color, draw_width):
+    def draw_arc(self, renderer, color, draw_width):
         """
         指定された色と幅で円弧を描画する。
-        param screen: 描画先の画面
+        param renderer: 描画命令を受け付けるRenderBackend
         param color: 描画する色
         param draw_width: 描画する線の幅
         """
@@ -54,6 +54,4 @@ class BaseArc:
             start_angle = self.angle - self.arc_range / 2
             end_angle = self.angle + self.arc_range / 2
 
-            # 円弧を描画するための矩形を作成
-            rect = pygame.Rect(int(self.center_pos[0] - self.radius), int(self.center_pos[1] - self.radius), int(self.radius * 2), int(self.radius * 2))
-            pygame.draw.arc(screen, color, rect, start_angle, end_angle, draw_width)
\ No newline at end of file
+            renderer.arc('beams', color, self.center_pos, self.radius, start_angle, end_angle, draw_width)
\ No newline at end of file
@@ -9,16 +9,18 @@ class Beam(BaseArc):
     """
 
     #-- クラス定数 ---
-    SPEED = BEAM_SPEED
+    SPEED = BEAM_SPEED * TICK_STEPS # 1ティックで広がる量
     MAX_RADIUS = BEAM_MAX_RADIUS
 
-    def __init__(self, center_pos, angle, arc_range, radius, width):
+    def __init__(self, center_pos, angle, arc_range, radius, width, cannon=0, beam_id=0):
         '''
         param center_pos: 光線の中心座標 (x, y)
         param angle: 光線の中心角度
         param arc_range: 光線の角度範囲
         param radius: 光線の初期半径（恒星の表面から）
         param width: 光線の線の幅  
+        param cannon: 発射した砲台の番号
+        param beam_id: 光線を識別する番号（恒星ごとに発射順に増える）
         '''
 
         super().__init__(
@@ -29,12 +31,16 @@ class Beam(BaseArc):
             width=width,
             color=WHITE
         )
+        self.prev_radius = radius # 直前のティック開始時の半径（連続的な衝突判定用）
         self.dodged = False # 回避されたかどうかを記録するフラグ
+        self.cannon = cannon # 発射した砲台の番号
+        self.id = beam_id # 光線を識別する番号
 
     def update(self):
         """
         光線の状態を更新する
         """
+        self.prev_radius = self.radius
         self.radius += self.SPEED # 光線が広がる速度で半径を増加
 
     def is_alive(self):
@@ -43,10 +49,10 @@ class Beam(BaseArc):
         """
         return self.radius < self.MAX_RADIUS # 最大半径に達していないか判定
 
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         光線を画面に描画する
-        param screen: 描画対象のPygameスクリーンオブジェクト
+        param renderer: 描画命令を受け付けるRenderBackend
         """
 
         # 半径(radius)が惑星の公転半径(225)を超えたらフェードアウト
@@ -59,13 +65,13 @@ class Beam(BaseArc):
         current_color = tuple(int(c * life_ratio) for c in self.color) 
         draw_width = min(self.width, int(self.radius))
         
-        self.draw_arc(screen, current_color, draw_width)
+        self.draw_arc(renderer, current_color, draw_width)
 
 class BeamCorpse(BaseArc):
     """
     衝突時に表示される光線の「死体」を表すクラス
     """
-    DURATION = FPS // 4 # 表示時間 (0.25秒)
+    DURATION = FPS // 4 # 表示時間 (0.25秒, フレーム数)
 
     def __init__(self, center_pos, angle, arc_range, radius, width):
         '''
@@ -89,7 +95,7 @@ class BeamCorpse(BaseArc):
         """
         死体の状態を更新する（フェードアウト）
         """
-        self.life -= 1
+        self.life -= TICK_STEPS
 
     def is_alive(self):
         """
@@ -97,12 +103,12 @@ class BeamCorpse(BaseArc):
         """
         return self.life > 0
 
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         死体を描画する（フェードアウト）
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         """
         if self.is_alive():
             life_ratio = self.life / self.DURATION
             current_color = tuple(int(c * life_ratio) for c in self.color)
-            self.draw_arc(screen, current_color, self.width)
\ No newline at end of file
+            self.draw_arc(renderer, current_color, self.width)
\ No newline at end of file
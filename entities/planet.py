@@ -1,6 +1,5 @@
 # entities/planet.py
 
-import pygame
 import math
 
 from .base import CelestialBody
@@ -37,7 +36,17 @@ class Planet(CelestialBody):
         )
         self.radius = radius # 公転の半径
         self.color = EARTH_BLUE
-        
+        self.reset(angle)
+
+    def reset(self, angle):
+        """
+        ラウンド開始時の状態に戻す（可変な状態のみをリセットする）
+        :param angle: 惑星の初期角度（ラジアン）
+        """
+        self.angle = angle
+        self.prev_angle = angle # 直前のティック開始時の角度（連続的な衝突判定用）
+        self.speed = 0.0
+
         # 表示用に、フレームごとの実際の角加速度を保持する
         self.actual_acceleration = 0.0
         
@@ -55,44 +64,45 @@ class Planet(CelestialBody):
         """
         # 実際の加速度を計算するために、更新前の速度を保存
         speed_before_update = self.speed
+        self.prev_angle = self.angle
 
         # 速度，角度を更新
-        self.update_angle_and_speed(direction)
+        self.update_angle_and_speed(direction, TICK_STEPS)
 
-        # HUD表示用の各加速度を計算
-        self.actual_acceleration = self.speed - speed_before_update
+        # HUD表示用の各加速度を計算（1フレームあたり）
+        self.actual_acceleration = (self.speed - speed_before_update) / TICK_STEPS
 
         # (x,y)座標を計算
         self.x = self.center_pos[0] + self.radius * math.cos(self.angle)
         self.y = self.center_pos[1] + self.radius * math.sin(self.angle)
 
-    def draw(self, screen):
+    def draw(self, renderer):
         '''
         惑星本体と軌道の描画
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         '''
         # --- 軌道の描画 ---
-        self.draw_trajectory(screen)
+        self.draw_trajectory(renderer)
 
         # --- 惑星本体の描画 ---
-        self.draw_planet(screen)
+        self.draw_planet(renderer)
     
-    def draw_planet(self, screen):
+    def draw_planet(self, renderer):
         """
         惑星本体を画面に描画する
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         """
 
         # --- 本体（ボール）の描画 ---
         # 惑星本体（黒い円）を描画
-        pygame.draw.circle(screen, BLACK, (int(self.x), int(self.y)), self.size)
+        renderer.circle('bodies', BLACK, (int(self.x), int(self.y)), self.size)
         # 惑星の縁（青色の枠）を描画
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size, CIRCLE_WIDTH)  # 幅2の枠
+        renderer.circle('bodies', self.color, (int(self.x), int(self.y)), self.size, CIRCLE_WIDTH)  # 幅2の枠
 
-    def draw_trajectory(self, screen):
+    def draw_trajectory(self, renderer):
         """
         惑星の軌道を画面に描画する
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         """
         for n in range(self.TRAJECTORY_NUM):
             tjy_angle = self.angle - self.MAX_TRAJECTORY_LENGTH * (self.speed / self.MAX_SPEED) * (n / self.TRAJECTORY_NUM)
@@ -100,4 +110,4 @@ class Planet(CelestialBody):
             tjy_y = self.center_pos[1] + self.radius * math.sin(tjy_angle)
             tjy_size = self.size * (1 - n / self.TRAJECTORY_NUM)
             tjy_color = tuple(int(c * (1 - n / self.TRAJECTORY_NUM)) for c in self.color)
-            pygame.draw.circle(screen, tjy_color, (int(tjy_x), int(tjy_y)), int(tjy_size))
\ No newline at end of file
+            renderer.circle('bodies', tjy_color, (int(tjy_x), int(tjy_y)), int(tjy_size))
\ No newline at end of file
@@ -1,6 +1,5 @@
 # entities/star.py
 
-import pygame
 import math
 import random
 
@@ -28,12 +27,23 @@ class Star(CelestialBody):
             acceleration=self.ACCELERATION,
             friction=self.FRICTION,
 
-            # 初期角度と速度はランダムに設定
-            angle=random.uniform(0, 2 * math.pi),
-            speed=random.uniform(-0.005, 0.005)
+            # 初期角度と速度は reset() でランダムに設定
+            angle=0.0,
+            speed=0.0
         )
         self.color = SUN_ORANGE
         self.arc_range = math.pi * 60 / 360  # 黒い円弧の描画範囲
+        self.cannon_initial_radius = self.size # 砲台の初期半径を保存
+        self.next_beam_id = 0 # 次に発射する光線の番号（ラウンドをまたいでも増え続ける）
+        self.reset()
+
+    def reset(self):
+        """
+        ラウンド開始時の状態に戻す（可変な状態のみをリセットする）
+        """
+        # 初期角度と速度はランダムに設定
+        self.angle = random.uniform(0, 2 * math.pi)
+        self.speed = random.uniform(-0.005, 0.005)
 
         # ランダム制御用のタイマーと現在の進行方向
         self.random_timer = 0
@@ -43,7 +53,6 @@ class Star(CelestialBody):
         # 砲台の発光を制御するためのタイマー
         self.cannon_flash_timers = [0, 0, 0]
         self.beams = [] # 発射した光線を管理するリスト
-        self.cannon_initial_radius = self.size # 砲台の初期半径を保存
         self.cannon_radii = [self.cannon_initial_radius] * 3 # 各砲台の半径
 
     def update(self):
@@ -56,23 +65,25 @@ class Star(CelestialBody):
             if not beam.is_alive():
                 self.beams.remove(beam)
 
-        self.random_timer += 1
-        self.beam_timer += 1
+        # タイマーはフレーム数で数え、超過分は次に持ち越す（ティックレートを下げても間隔を保つ）
+        self.random_timer += TICK_STEPS
+        self.beam_timer += TICK_STEPS
 
         # 加速度をランダムに変更
         if self.random_timer >= FPS // 8:
-            self.random_timer = 0
+            self.random_timer -= FPS // 8
             # 加速度0を選ぶ確率を20%、左右をそれぞれ40%に設定
             self.random_direction = random.choices([-1, 0, 1], weights=[40, 20, 40], k=1)[0]
 
         # 光線を発射
         if self.beam_timer >= FPS // 8:
-            self.beam_timer = 0
+            self.beam_timer -= FPS // 8
             # 3つの砲台から光線を発射
             for i in range(3):  
                 if random.random() < 0.20: # 20%の確率で発射
                     cannon_angle = self.angle + (2 * math.pi / 3) * i
-                    beam = Beam(self.center_pos, cannon_angle, self.arc_range, self.size, int(self.size // 4))
+                    beam = Beam(self.center_pos, cannon_angle, self.arc_range, self.size, int(self.size // 4), i, self.next_beam_id)
+                    self.next_beam_id += 1
                     self.beams.append(beam)
                     # 発射エフェクト：対応する砲台の半径を一時的に小さくする
                     self.cannon_radii[i] = self.cannon_initial_radius * 0.75
@@ -80,26 +91,26 @@ class Star(CelestialBody):
         # 各砲台の半径を徐々に初期サイズに戻す
         for i in range(3):
             if self.cannon_radii[i] < self.cannon_initial_radius:
-                self.cannon_radii[i] += 0.5  # 半径の回復速度
+                self.cannon_radii[i] += 0.5 * TICK_STEPS  # 半径の回復速度
                 # 初期半径を超えないように補正
                 if self.cannon_radii[i] > self.cannon_initial_radius:
                     self.cannon_radii[i] = self.cannon_initial_radius
 
-        self.update_angle_and_speed(self.random_direction)
+        self.update_angle_and_speed(self.random_direction, TICK_STEPS)
         
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         恒星、砲台、光線を画面に描画する
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         """
-        # 発射された光線を描画 (恒星より奥にあるように見せるため先に描画)
+        # 発射された光線を描画 (光線は 'beams' レイヤーなので恒星より奥に描画される)
         for beam in self.beams:
-            beam.draw(screen)
+            beam.draw(renderer)
 
         # 恒星本体（黒い円）を描画
-        pygame.draw.circle(screen, BLACK, self.center_pos, self.size / 2)
+        renderer.circle('bodies', BLACK, self.center_pos, self.size / 2)
         # 恒星の縁（オレンジ色の枠）を描画
-        pygame.draw.circle(screen, self.color, self.center_pos, self.size / 2, CIRCLE_WIDTH)  # 幅2の枠
+        renderer.circle('bodies', self.color, self.center_pos, self.size / 2, CIRCLE_WIDTH)  # 幅2の枠
 
         # 次に、angle付近に砲台を描画します
         for i in range(3):  # 3つの砲台を描画
@@ -108,5 +119,4 @@ class Star(CelestialBody):
             cannon_angle = self.angle + (2 * math.pi / 3) * i  
             start_angle = cannon_angle - self.arc_range / 2
             end_angle = cannon_angle + self.arc_range / 2
-            rect = pygame.Rect(self.center_pos[0] - arc_radius, self.center_pos[1] - arc_radius, arc_radius * 2, arc_radius * 2)
-            pygame.draw.arc(screen, self.color, rect, start_angle, end_angle, int(self.size // 4))
\ No newline at end of file
+            renderer.arc('bodies', self.color, self.center_pos, arc_radius, start_angle, end_angle, int(self.size // 4))
\ No newline at end of file
@@ -3,9 +3,17 @@
 import pygame
 import sys       
 import random  
+import time
+import gc
 
 from config import *
+from assets import AssetCache
+from mode.scene import SceneManager
+from render.backend import create_backend
+from diagnostics.latency import LatencyProbe
+from mode.input import INPUT_EVENT_TYPES
 from mode.play.play import Play
+from mode.arena.arena import Arena
 from mode.system.system import System
 
 class Game:
@@ -13,26 +21,70 @@ class Game:
     ゲーム全体を管理するメインクラス
     """
 
-    def __init__(self):
+    def __init__(self, render_backend=RENDER_BACKEND, render_accelerated=RENDER_ACCELERATED, capture=None, telemetry=None, spectator=None,
+                 alloc_tracker=None, latency_report=False):
         """
         Gameオブジェクトの初期化
+        :param render_backend: 描画バックエンド名 ('surface' or 'sdl2')
+        :param render_accelerated: sdl2バックエンドのレンダラ (-1: 自動, 0: ソフトウェア, 1: ハードウェア)
+        :param capture: 画面を録画するFrameCapture（Noneなら録画しない）
+        :param telemetry: ラウンドと光線を記録するTelemetrySink（Noneなら記録しない）
+        :param spectator: プレイ中の状態を配信するSpectatorServer（Noneなら配信しない）
+        :param alloc_tracker: フレームごとのメモリ割り当てを計測するAllocationTracker（Noneなら計測しない）
+        :param latency_report: 終了時に遅延の集計を表示するか
         """
         # Pygameの初期化
         pygame.init()
-        # 画面の設定
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 画面の設定（描画命令をレイヤーごとにまとめて書き出すバックエンドを生成）
+        self.renderer = create_backend(render_backend, (SCREEN_WIDTH, SCREEN_HEIGHT), "ORBITAL SURVIVAL", render_accelerated)
         self.clock = pygame.time.Clock()
-        pygame.display.set_caption("ORBITAL SURVIVAL")
         
         self.is_running = True # 人間がプレイする際のループ制御用
-        self.game_mode = 'system'  # ゲームモードの初期設定
 
-        # --- 背景の星を生成 ---
-        self.background_stars = self._create_stars_(NUM_BACKGROUND_STARS)
+        # フォント・ボタン画像・背景レイヤーを共有するキャッシュ
+        self.assets = AssetCache(self.renderer.prepare_surface)
 
-        # ゲームモードオブジェクトの初期化
-        self.play = Play(self.screen, self.clock)
-        self.system = System(self.screen)
+        # --- 背景の星を生成 ---
+        # 星は毎フレーム描き直さず、一枚の背景レイヤーに事前描画しておく
+        self.background = self.assets.surface(('background',), lambda: self._create_background_(NUM_BACKGROUND_STARS))
+
+        # ゲームモード（シーン）の登録
+        self.scenes = SceneManager()
+        self.scenes.register('system', System(self.renderer, self.assets))
+        self.scenes.register('play', Play(self.renderer, self.clock, self.assets))
+        self.scenes.register('arena', Arena(self.renderer, self.assets))
+        self.scenes.change('system') # ゲームモードの初期設定
+
+        # 録画する場合は、あとでオフライン描画できるようにリプレイログも同じ場所に保存する
+        self.capture = capture
+        if capture is not None:
+            self.scenes.scenes['play'].replay_dir = capture.out_dir
+
+        self.telemetry = telemetry
+        self.scenes.scenes['play'].telemetry = telemetry
+
+        self.spectator = spectator
+        if spectator is not None:
+            spectator.start()
+        self.scenes.scenes['play'].spectator = spectator
+
+        self.alloc_tracker = alloc_tracker
+        self.latency_report = latency_report # 終了時に遅延の集計を表示するか
+
+        # 入力イベントの時刻から、それを反映したフレームの表示が終わるまでの遅延を計測する
+        self.latency_probe = LatencyProbe()
+        self.scenes.scenes['play'].input.probe = self.latency_probe
+        self.scenes.scenes['arena'].input.probe = self.latency_probe
+        self._next_frame = None # 次のフレームを始める時刻[s]
+
+        # 起動時に読み込んだモジュール・画像・シーンなどを世代別GCの走査対象から外す
+        # （毎フレーム大量の描画命令を作って捨てるArenaでは、最古の世代の走査がフレームを止めるため）
+        gc.freeze()
+
+    @property
+    def game_mode(self):
+        """現在のゲームモード名"""
+        return self.scenes.current_name
 
     #--- 背景の星を生成 ---
     def _create_stars_(self, num_stars):
@@ -49,57 +101,92 @@ class Game:
             stars.append({'pos': (x, y), 'radius': radius, 'color': color})
         return stars
 
+    def _create_background_(self, num_stars):
+        """背景の星を描画済みのSurface（背景レイヤー）を生成する"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill(BLACK)
+        for star_data in self._create_stars_(num_stars):
+            pygame.draw.circle(background, star_data['color'], star_data['pos'], star_data['radius'])
+        return background
+
     #--- イベント処理 ---
     def _handle_events_(self):
         """
         キーボードやマウスのイベントを処理する
         """
 
+        now = time.perf_counter()
         for event in pygame.event.get():
-            # ウィンドウの閉じるボタンが押されたらループを抜ける
-            if event.type == pygame.QUIT:
-                self.is_running = False
-
-            # ゲームモードごとのイベント処理
-            if self.game_mode == 'system':
-                if self.system.system_button.is_pressed(event):
-                    self.game_mode = 'play'
-                    self.play.initialize_play_state()  # プレイモードの初期化
-            elif self.game_mode == 'play':
-                if self.system.system_button.is_pressed(event):
-                    self.game_mode = 'system'
+            self._dispatch_(event, now)
+
+    def _dispatch_(self, event, timestamp):
+        """
+        イベントに受け取った時刻を付けて処理する
+        :param event: Pygameのイベント
+        :param timestamp: イベントをキューから取り出した時刻[s]（time.perf_counter() の値）
+        """
+        event.timestamp = timestamp
+
+        # ウィンドウの閉じるボタンが押されたらループを抜ける
+        if event.type == pygame.QUIT:
+            self.is_running = False
+
+        # ゲームモードごとのイベント処理（遷移はSceneManagerが行う）
+        self.scenes.handle_event(event)
+
+    def _wait_for_next_frame_(self):
+        """
+        次のフレームの開始時刻まで待つ（clock.tick(FPS) の代わり）
+        待っているあいだも入力イベントだけを INPUT_POLL_INTERVAL ごとに取り出し、届いた時刻を記録する
+        （まとめて次のフレームの先頭で取り出すと、待ち時間の分だけ時刻がずれ、短い押下の長さがわからなくなる）
+        """
+        frame_time = 1.0 / FPS
+        now = time.perf_counter()
+        if self._next_frame is None:
+            self._next_frame = now
+        # 大きく遅れた場合は、遅れを取り戻そうとせず今から数え直す
+        self._next_frame = max(self._next_frame + frame_time, now)
+
+        while True:
+            for event in pygame.event.get(INPUT_EVENT_TYPES):
+                self._dispatch_(event, now)
+            remaining = self._next_frame - now
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, INPUT_POLL_INTERVAL))
+            now = time.perf_counter()
+        # フレーム時間の計測のみ（待ちは上で行う）
+        self.clock.tick()
 
     #--- ゲーム状態の更新 ---
     def _update_(self):
         """
         ゲーム内の各オブジェクトの状態を更新する
         """
-        if self.game_mode == 'system':
-            self.system.update()
-        elif self.game_mode == 'play':
-            self.play.update()
-        else:
-            self.system.update()
-
+        self.scenes.update()
 
     #--- 描画 ---
     def _draw_(self):
         """
         画面に各オブジェクトを描画する
         """
-        self.screen.fill(BLACK)
-        
-        for star_data in self.background_stars:
-            pygame.draw.circle(self.screen, star_data['color'], star_data['pos'], star_data['radius'])
+        self.renderer.blit('background', self.background, (0, 0))
+
+        self.scenes.draw()
+
+        # メモリ計測：ここまでに確保されて生きているもの（描画命令など）がこのフレームの割り当て
+        if self.alloc_tracker is not None:
+            self.alloc_tracker.checkpoint()
+
+        # レイヤーごとにまとめて書き出す（描画回数は self.renderer.last_frame_stats で参照できる）
+        self.renderer.flush()
 
-        if self.game_mode == 'system':
-            self.system.draw()
-        elif self.game_mode == 'play':
-            self.play.draw()
-        else:
-            self.system.draw()
+        # 録画（共有メモリのリングバッファへのピクセルのコピーのみ。変換・書き出しは別プロセス）
+        if self.capture is not None:
+            self.capture.grab(self.renderer.capture_surface())
 
-        pygame.display.flip()
+        self.renderer.present()
+        self.latency_probe.presented()
 
     def run(self):
         """
@@ -108,6 +195,8 @@ class Game:
 
         # ゲームループ
         while self.is_running:
+            if self.alloc_tracker is not None:
+                self.alloc_tracker.begin_frame()
             # 1. イベント処理
             self._handle_events_()
             # 2. ゲームの状態更新
@@ -115,8 +204,25 @@ class Game:
             # 3. ゲームモードの実行
             self._draw_()
             # 4. フレームレートの制御
-            self.clock.tick(FPS)
+            self._wait_for_next_frame_()
+            if self.alloc_tracker is not None:
+                self.alloc_tracker.end_frame(self.scenes.current.live_entities())
 
         # ゲーム終了処理
+        self.scenes.current.exit()
+        if self.capture is not None:
+            self.capture.close()
+            print(self.capture.report())
+        if self.telemetry is not None:
+            self.telemetry.close()
+        if self.spectator is not None:
+            self.spectator.stop()
+        if self.alloc_tracker is not None:
+            print(self.alloc_tracker.report())
+            self.alloc_tracker.close()
+        # リスタート（シーン遷移）の所要時間と、入力から画面表示までの遅延を報告
+        if self.latency_report:
+            print(self.scenes.latency_report())
+            print(self.latency_probe.report())
         pygame.quit()
         sys.exit()
@@ -1,7 +1,63 @@
 # main.py
+import argparse
+
+from config import RENDER_BACKEND, RENDER_ACCELERATED, SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 from game import Game
+from render.backend import BACKENDS
+from capture.frame_capture import FrameCapture, POLICIES, positive_int
+from capture.writers import FORMATS
+from telemetry.sink import TelemetrySink
+from spectator.server import SpectatorServer
+from diagnostics.allocations import AllocationTracker
+
+def parse_args():
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(description="ORBITAL SURVIVAL")
+    parser.add_argument('--renderer', choices=BACKENDS, default=RENDER_BACKEND,
+                        help="描画バックエンド (default: %(default)s)")
+    parser.add_argument('--software-renderer', action='store_true',
+                        help="sdl2バックエンドでSDLのソフトウェアレンダラを使う（GPU不要）")
+    parser.add_argument('--capture', metavar='DIR',
+                        help="プレイ画面をDIRに録画する（リプレイログも保存される）")
+    parser.add_argument('--capture-format', choices=FORMATS, default='png',
+                        help="録画の出力形式 (default: %(default)s)")
+    parser.add_argument('--capture-every', type=positive_int, default=2,
+                        help="何フレームごとに1枚録画するか (default: %(default)s)")
+    parser.add_argument('--capture-policy', choices=POLICIES, default='drop_newest',
+                        help="書き出しが追いつかないときの方針 (default: %(default)s)")
+    parser.add_argument('--telemetry', metavar='DIR',
+                        help="ラウンドと光線の記録をDIRのテレメトリストアに追記する")
+    parser.add_argument('--spectate', metavar='PORT', type=int,
+                        help="プレイ中の状態を localhost:PORT で観戦クライアントに配信する")
+    parser.add_argument('--spectate-unix', metavar='PATH',
+                        help="プレイ中の状態をUnixソケットPATHで観戦クライアントに配信する")
+    parser.add_argument('--track-alloc', metavar='N', type=positive_int,
+                        help="Nフレームごとにメモリ割り当てを計測し、終了時に関数ごとの集計を表示する（遅くなる）")
+    parser.add_argument('--alloc-json', metavar='PATH',
+                        help="--track-alloc の集計結果をPATHにJSONで書き出す")
+    parser.add_argument('--latency-report', action='store_true',
+                        help="終了時にリスタート（シーン遷移）と入力から画面表示までの遅延を表示する")
+    return parser.parse_args()
 
 if __name__ == '__main__':
+    args = parse_args()
+    accelerated = 0 if args.software_renderer else RENDER_ACCELERATED
+
+    capture = None
+    if args.capture:
+        capture = FrameCapture(args.capture, (SCREEN_WIDTH, SCREEN_HEIGHT), args.capture_format,
+                               args.capture_every, policy=args.capture_policy, fps=FPS // args.capture_every)
+
+    telemetry = TelemetrySink(args.telemetry) if args.telemetry else None
+
+    spectator = None
+    if args.spectate is not None or args.spectate_unix:
+        spectator = SpectatorServer(port=args.spectate, unix_path=args.spectate_unix)
+
+    alloc_tracker = None
+    if args.track_alloc is not None:
+        alloc_tracker = AllocationTracker(every=args.track_alloc, json_path=args.alloc_json)
+
     # Gameオブジェクトを生成し、ゲームを開始
-    game = Game()
-    game.run()
\ No newline at end of file
+    game = Game(args.renderer, accelerated, capture, telemetry, spectator, alloc_tracker, args.latency_report)
+    game.run()
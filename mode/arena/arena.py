@@ -0,0 +1,71 @@
+# mode/arena/arena.py
+
+from config import *
+from mode.arena.world import ArenaWorld
+from mode.input import InputTimeline
+from mode.scene import Scene
+from mode.system.ui.system_button import System_Button
+
+class Arena(Scene):
+    """
+    ARENAモード（多数の恒星と惑星が登場するモード）を管理するクラス
+    プレイヤーはすべての惑星を同時に操作する
+    """
+
+    def __init__(self, renderer, assets):
+        """
+        Arenaオブジェクトの初期化
+        :param renderer: 描画命令を受け付けるRenderBackend
+        :param assets: フォントを共有するAssetCache
+        """
+        self.renderer = renderer
+        self.system_button = System_Button()
+        self.font = assets.font(30)
+        # 配列はラウンドをまたいで使い回す
+        self.world = ArenaWorld()
+        self.frame_count = 0
+        # 左右キーの入力を時刻つきで記録し、ティックごとに押されていた時間を積分する
+        self.input = InputTimeline()
+
+    def enter(self):
+        """アリーナに入るたびにラウンドを初期化する"""
+        self.world.reset()
+        self.frame_count = 0
+        self.input.reset()
+
+    def handle_event(self, event):
+        """操作の入力を記録し、スペースキーでシステム画面に戻る"""
+        self.input.record(event)
+        if self.system_button.is_pressed(event):
+            return 'system'
+        return None
+
+    def update(self):
+        """
+        記録した入力から加速方向を求め、シミュレーションを進める
+        """
+        # 描画は毎フレーム、シミュレーションは TICK_STEPS フレームに1回（TICK_RATE）進める
+        self.frame_count += 1
+        if self.frame_count < TICK_STEPS:
+            return
+        self.frame_count = 0
+        # シミュレーションの直前に、前のティックのあいだ押されていた時間の割合を加速方向とする
+        self.world.step(self.input.latch())
+
+    def live_entities(self):
+        """生きているエンティティの数（メモリ計測用）"""
+        world = self.world
+        return {'stars': len(world.stars), 'planets': len(world.planets),
+                'beams': len(world.beams), 'corpses': len(world.corpses)}
+
+    def draw(self):
+        """
+        画面に各オブジェクトを描画する
+        """
+        world = self.world
+        world.draw(self.renderer)
+
+        time_rect = self.renderer.text('hud', self.font, f"TIME: {world.elapsed_time() / 1000:6.2f}s", GREEN, topleft=(10, 10))
+        score_rect = self.renderer.text('hud', self.font, f"SCORE: {world.score}", GREEN, topleft=(10, time_rect.bottom + 5))
+        self.renderer.text('hud', self.font, f"KILLED: {world.kill_count}", GREEN, topleft=(10, score_rect.bottom + 5))
+        self.renderer.text('hud', self.font, f"BEAMS: {len(world.beams):5d}", GREEN, topright=(SCREEN_WIDTH - 10, 10))
@@ -0,0 +1,78 @@
+# mode/arena/components.py
+
+import numpy as np
+
+class ComponentArray:
+    """
+    同じ種類のエンティティの成分を、成分ごとの連続した配列で持つ入れ物（SoA）
+    エンティティは 0..count-1 の添字で表し、更新・衝突判定・描画は成分の配列をまとめて処理する。
+    削除は keep() で生き残った行を前に詰めるので、配列に穴は空かない。
+    """
+
+    def __init__(self, fields, capacity=256):
+        """
+        ComponentArrayオブジェクトの初期化
+        :param fields: 成分名 -> dtype、または (dtype, 1行の形) の辞書
+        :param capacity: 最初に確保する行数（足りなくなれば倍に広げる）
+        """
+        self.count = 0
+        self._specs = {}
+        self._arrays = {}
+        for name, spec in fields.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            self._specs[name] = (np.dtype(dtype), shape)
+            self._arrays[name] = np.zeros((capacity,) + shape, dtype=dtype)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name):
+        """成分の配列（有効な count 行分のビュー）"""
+        return self._arrays[name][:self.count]
+
+    def __setitem__(self, name, values):
+        """成分の有効な count 行に値を書き込む（beams['radius'] += 1 のような書き方のため）"""
+        self._arrays[name][:self.count] = values
+
+    def _reserve(self, rows):
+        """rows 行が入るように配列を広げる"""
+        capacity = len(next(iter(self._arrays.values())))
+        if rows <= capacity:
+            return
+        # 容量0から広げる場合も無限ループにならないよう、rows 以上の最小の2の累乗にする
+        capacity = max(capacity * 2, 1 << (rows - 1).bit_length())
+        for name, (dtype, shape) in self._specs.items():
+            grown = np.zeros((capacity,) + shape, dtype=dtype)
+            grown[:self.count] = self._arrays[name][:self.count]
+            self._arrays[name] = grown
+
+    def add(self, rows, **values):
+        """
+        rows 個のエンティティを末尾に追加する
+        :param rows: 追加する数
+        :param values: 成分名 -> 値（長さ rows の配列、またはスカラー）。省略した成分は0
+        :return: 追加した範囲の slice
+        """
+        start = self.count
+        self._reserve(start + rows)
+        added = slice(start, start + rows)
+        for name, array in self._arrays.items():
+            array[added] = values.get(name, 0)
+        self.count += rows
+        return added
+
+    def keep(self, mask):
+        """
+        mask が True の行だけを残し、順序を保ったまま前に詰める
+        :param mask: 長さ count の真偽値配列
+        """
+        kept = int(np.count_nonzero(mask))
+        if kept == self.count:
+            return
+        for array in self._arrays.values():
+            array[:kept] = array[:self.count][mask]
+        self.count = kept
+
+    def clear(self):
+        """すべてのエンティティを削除する（配列は確保したまま）"""
+        self.count = 0
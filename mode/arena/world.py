@@ -0,0 +1,464 @@
+# mode/arena/world.py
+
+import math
+
+import numpy as np
+
+from config import *
+from mode.arena.components import ComponentArray
+from mode.play.collision import TWO_PI, angle_margins, band_intervals, wrap_angle
+
+def _ramp(counts):
+    """counts = [2, 3] -> [0, 1, 0, 1, 2]（np.repeat で展開した各要素の、グループ内での番号）"""
+    total = int(counts.sum())
+    return np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+
+class ArenaWorld:
+    """
+    Arenaモードのシミュレーション
+    恒星・惑星・光線・死体をそれぞれ ComponentArray に持ち、更新・衝突判定・描画は配列単位で行う。
+    光線と惑星の衝突判定は、恒星ごとの (リング, セクター) のセルで候補を絞ってから調べる。
+    """
+    # --- クラス定数 ---
+    CANNONS = 3 # 恒星1つあたりの砲台の数
+    ARC_RANGE = math.pi * 60 / 360 # 光線・砲台の角度範囲
+    BEAM_WIDTH = ARENA_STAR_SIZE // 4 # 光線の幅（衝突判定用）
+    BEAM_DRAW_WIDTH = 1 # 光線を描く線の幅（sdl2 バックエンドの線と同じ1px。線の太さの分だけ描画が重くなるため）
+    BEAM_SPEED = BEAM_SPEED * TICK_STEPS # 1ティックで広がる量
+    CORPSE_DURATION = FPS // 4 # 死体の表示時間（フレーム数）
+    # 円弧を近似する折れ線の区間数。弦と円弧のずれ（半径 * 区間の角度^2 / 8）が約1px以下になるよう、
+    # 半径が ARC_LOD_RADII[i] 未満なら ARC_SEGMENTS[i] 区間、それより大きければ最後の区間数で描く
+    ARC_SEGMENTS = (2, 3, 4, 5, 6)
+    ARC_LOD_RADII = (117.0, 263.0, 467.0, 730.0)
+    FADE_LEVELS = 4 # 光線のフェードアウトの段階数（段階ごとに1回の描画命令にまとめる）
+
+    def __init__(self, num_stars=ARENA_NUM_STARS, orbits=ARENA_PLANET_ORBITS, seed=None):
+        """
+        ArenaWorldオブジェクトの初期化
+        :param num_stars: 恒星の数
+        :param orbits: 惑星の公転半径のシーケンス（惑星1つにつき1つ）
+        :param seed: 乱数シード
+        """
+        self.num_stars = num_stars
+        self.orbits = orbits
+
+        self.stars = ComponentArray({
+            'x': 'f8', 'y': 'f8',
+            'angle': 'f8', 'speed': 'f8',
+            'direction': 'i1', # ランダムに選んだ加速方向
+            'cannon_radii': ('f8', (self.CANNONS,)),
+        }, capacity=num_stars)
+        self.planets = ComponentArray({
+            'orbit': 'f8', 'angle': 'f8', 'prev_angle': 'f8', 'speed': 'f8',
+        }, capacity=len(orbits))
+        self.beams = ComponentArray({
+            'star': 'i4', 'cannon': 'u1',
+            'x': 'f8', 'y': 'f8', # 中心座標（発射した恒星の位置）
+            'angle': 'f8', 'radius': 'f8',
+            'prev_radius': 'f8', # 直前のティック開始時の半径（連続的な衝突判定用）
+            'dodged': ('?', (len(orbits),)), # 惑星ごとに、すでに回避として数えたか（Beam.dodged と同じ）
+        }, capacity=4096)
+        self.corpses = ComponentArray({
+            'x': 'f8', 'y': 'f8', 'angle': 'f8', 'radius': 'f8', 'life': 'i4',
+        })
+
+        # 衝突判定の空間分割（恒星からの距離のリング × 角度のセクター）
+        self.reach = self.BEAM_WIDTH + PLANET_SIZE # 光線の半径がこの範囲なら惑星と重なる
+        self.num_rings = int((ARENA_BEAM_MAX_RADIUS + self.reach) // ARENA_RING_WIDTH) + 2
+        self.sector_angle = TWO_PI / ARENA_SECTORS
+        # 直前のティックの衝突判定の統計（総当たりなら beams * planets 組）
+        self.collision_stats = {'beams': 0, 'cells': 0, 'pairs': 0, 'hits': 0}
+
+        # 円弧の頂点を、弧の中心方向の単位ベクトルを回転させて求めるための cos, sin（区間数ごと）
+        self.arc_rotations = []
+        for segments in self.ARC_SEGMENTS:
+            offsets = np.linspace(-self.ARC_RANGE / 2, self.ARC_RANGE / 2, segments + 1)
+            self.arc_rotations.append((np.cos(offsets), np.sin(offsets)))
+
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """
+        ラウンド開始時の状態に戻す（配列は確保したまま使い回す）
+        :param seed: 乱数シード
+        """
+        self.rng = np.random.default_rng(seed)
+        self.tick = 0
+        self.random_timer = 0
+        self.beam_timer = 0
+        self.score = 0
+        self.kill_count = 0
+        self.dodge_count = 0
+
+        margin = ARENA_STAR_SIZE
+        self.stars.clear()
+        self.stars.add(
+            self.num_stars,
+            x=self.rng.uniform(margin, SCREEN_WIDTH - margin, self.num_stars),
+            y=self.rng.uniform(margin, SCREEN_HEIGHT - margin, self.num_stars),
+            angle=self.rng.uniform(0, TWO_PI, self.num_stars),
+            speed=self.rng.uniform(-0.005, 0.005, self.num_stars),
+            cannon_radii=ARENA_STAR_SIZE,
+        )
+
+        # 惑星は公転半径ごとに1つ、角度をずらして配置する
+        num_planets = len(self.orbits)
+        angles = PLANET_INITIAL_ANGLE + TWO_PI * np.arange(num_planets) / num_planets
+        self.planets.clear()
+        self.planets.add(num_planets, orbit=np.asarray(self.orbits, dtype=float), angle=angles, prev_angle=angles)
+
+        self.beams.clear()
+        self.corpses.clear()
+
+    def elapsed_time(self):
+        """ラウンド開始からの経過時間[ms]"""
+        return self.tick * 1000 // TICK_RATE
+
+    # --- 更新 ---
+
+    def step(self, direction):
+        """
+        入力方向を受け取り、1ティック分シミュレーションを進める
+        :param direction: すべての惑星の加速方向 (-1.0 ~ 1.0。-1: 右, 0: 無し, 1: 左)
+        """
+        self._update_planets(direction)
+        self._update_beams()
+        self._update_stars()
+        self._update_corpses()
+        self._check_collisions()
+        self._check_dodges()
+        self.tick += 1
+
+    @staticmethod
+    def _integrate(speed, angle, direction, acceleration, friction):
+        """CelestialBody.update_angle_and_speed と同じ積分を配列にまとめて適用する（その場で更新）"""
+        for _ in range(TICK_STEPS):
+            speed += acceleration * direction
+            speed *= friction
+            angle += speed
+
+    def _update_planets(self, direction):
+        planets = self.planets
+        planets['prev_angle'] = planets['angle']
+        self._integrate(planets['speed'], planets['angle'], direction, PLANET_ACCELERATION, PLANET_FRICTION)
+
+    def _update_beams(self):
+        """光線を広げ、最大半径に達したものを削除する（回避は _check_dodges で数える）"""
+        beams = self.beams
+        beams['prev_radius'] = beams['radius']
+        radius = beams['radius']
+        radius += self.BEAM_SPEED
+        beams.keep(radius < ARENA_BEAM_MAX_RADIUS)
+
+    def _update_stars(self):
+        """恒星をランダムに回転させ、砲台から光線を発射する（Star.update と同じ規則）"""
+        stars = self.stars
+        self.random_timer += TICK_STEPS
+        self.beam_timer += TICK_STEPS
+
+        # 加速度をランダムに変更（0を20%、左右をそれぞれ40%）
+        if self.random_timer >= FPS // 8:
+            self.random_timer -= FPS // 8
+            stars['direction'] = self.rng.choice((-1, 0, 1), size=len(stars), p=(0.4, 0.2, 0.4))
+
+        # 光線を発射
+        if self.beam_timer >= FPS // 8:
+            self.beam_timer -= FPS // 8
+            fire = self.rng.random((len(stars), self.CANNONS)) < ARENA_FIRE_PROBABILITY
+            star_index, cannon = np.nonzero(fire)
+            self.beams.add(
+                len(star_index),
+                star=star_index, cannon=cannon,
+                x=stars['x'][star_index], y=stars['y'][star_index],
+                angle=stars['angle'][star_index] + (TWO_PI / self.CANNONS) * cannon,
+                radius=ARENA_STAR_SIZE, prev_radius=ARENA_STAR_SIZE,
+            )
+            # 発射エフェクト：砲台の半径を一時的に小さくする
+            radii = stars['cannon_radii']
+            radii[fire] = ARENA_STAR_SIZE * 0.75
+
+        # 各砲台の半径を徐々に初期サイズに戻す
+        radii = stars['cannon_radii']
+        np.minimum(radii + 0.5 * TICK_STEPS, ARENA_STAR_SIZE, out=radii)
+
+        self._integrate(stars['speed'], stars['angle'], stars['direction'], STAR_ACCELERATION, STAR_FRICTION)
+
+    def _update_corpses(self):
+        corpses = self.corpses
+        life = corpses['life']
+        life -= TICK_STEPS
+        corpses.keep(life > 0)
+
+    # --- 衝突判定 ---
+
+    def planet_positions(self, angles):
+        """惑星の角度から画面上の座標 (x, y) の配列を求める"""
+        orbits = self.planets['orbit']
+        return CENTER_POS[0] + orbits * np.cos(angles), CENTER_POS[1] + orbits * np.sin(angles)
+
+    def _planet_tracks(self):
+        """
+        各恒星から見た惑星の距離と角度（恒星 × 惑星 の組ごとに平らに並べる。番号は 恒星 * 惑星の数 + 惑星）
+        :return: (開始時の距離, 終了時の距離, 開始時の角度, ティック中の角度の変化)
+        """
+        stars, planets = self.stars, self.planets
+        sx = stars['x'][:, None]
+        sy = stars['y'][:, None]
+        x1, y1 = self.planet_positions(planets['angle'])
+        x0, y0 = self.planet_positions(planets['prev_angle'])
+        d0 = np.hypot(x0 - sx, y0 - sy).ravel()
+        d1 = np.hypot(x1 - sx, y1 - sy).ravel()
+        theta0 = np.arctan2(y0 - sy, x0 - sx).ravel()
+        dtheta = wrap_angle(np.arctan2(y1 - sy, x1 - sx).ravel() - theta0)
+        return d0, d1, theta0, dtheta
+
+    def _narrow_phase(self, pair_beam, pair_owner, d0, d1, theta0, dtheta):
+        """
+        光線と (恒星, 惑星) の組ごとに、mode/play/collision.py と同じ連続的な判定を行う
+        :param pair_beam: 組の光線の番号
+        :param pair_owner: 組の (恒星, 惑星) の番号（_planet_tracks の並び）
+        :return: 衝突したかの真偽値配列
+        """
+        beams = self.beams
+        # 半径方向：光線が惑星の帯（±reach）に入っているフレームの区間 [lo, hi]
+        lo, hi, inside = band_intervals(beams['prev_radius'][pair_beam], beams['radius'][pair_beam],
+                                        d0[pair_owner], d1[pair_owner], self.reach, TICK_STEPS)
+
+        # 角度方向：区間 [lo, hi] の間に惑星が弧（±マージン）の角度に入るか
+        # マージンは区間の端での惑星までの距離（小さいほう）から求める
+        change = d1[pair_owner] - d0[pair_owner]
+        distance = d0[pair_owner] + change * np.where(change > 0, lo, hi)
+        margin = angle_margins(distance, PLANET_SIZE)
+        delta = dtheta[pair_owner]
+        d_lo = wrap_angle(theta0[pair_owner] + delta * lo + beams['angle'][pair_beam])
+        d_hi = d_lo + delta * (hi - lo)
+        low = np.minimum(d_lo, d_hi)
+        high = np.maximum(d_lo, d_hi)
+        crosses = ((low <= 0) & (0 <= high)) | ((low <= TWO_PI) & (TWO_PI <= high)) | ((low <= -TWO_PI) & (-TWO_PI <= high))
+        nearest = np.where(crosses, 0.0, np.minimum(np.abs(d_lo), np.abs(wrap_angle(d_hi))))
+        return inside & (nearest < self.ARC_RANGE / 2 + margin)
+
+    def _check_dodges(self):
+        """
+        衝突しなかった光線が惑星を越えたら回避とみなす（Play の check_collisions と同じ規則）
+        光線の半径が、発射した恒星から惑星までの距離より外側で帯（±reach）を抜けたときに、惑星ごとに1回だけ数える
+        """
+        beams = self.beams
+        if len(beams) == 0:
+            return
+        stars = self.stars
+        xs, ys = self.planet_positions(self.planets['angle'])
+        star_distance = np.hypot(xs - stars['x'][:, None], ys - stars['y'][:, None]) # 恒星 × 惑星
+        passed = beams['radius'][:, None] >= star_distance[beams['star']] + self.reach
+        dodged = beams['dodged']
+        passed &= ~dodged
+        count = int(np.count_nonzero(passed))
+        if count == 0:
+            return
+        dodged |= passed
+        self.dodge_count += count
+        self.score += 10 * count
+
+    def _cell_keys(self, star, ring_lo, num_rings, sector_lo, num_sectors):
+        """
+        各エンティティが覆う (恒星, リング, セクター) のセルを列挙する
+        :return: (セルのキー, そのセルを覆うエンティティの番号)
+        """
+        cells = num_rings * num_sectors
+        owner = np.repeat(np.arange(len(star)), cells)
+        local = _ramp(cells)
+        width = num_sectors[owner]
+        ring = ring_lo[owner] + local // width
+        sector = (sector_lo[owner] + local % width) % ARENA_SECTORS
+        return (star[owner] * self.num_rings + ring) * ARENA_SECTORS + sector, owner
+
+    def _check_collisions(self):
+        """
+        光線と惑星の衝突を判定する
+        1. 惑星を、各恒星から見てティック中に通過したリング・セクターのセルに登録する
+        2. 光線ごとに、ティック中に広がった範囲と弧の角度が覆うセルから候補の惑星を引く
+        3. 候補の組だけを mode/play/collision.py と同じ連続的な判定（_narrow_phase）で調べる
+        候補の絞り込みに使う範囲は、3. で衝突しうる範囲をすべて含むように同じ区間から求める
+        """
+        stars, planets, beams = self.stars, self.planets, self.beams
+        num_beams, num_planets = len(beams), len(planets)
+        self.collision_stats = {'beams': num_beams, 'cells': 0, 'pairs': 0, 'hits': 0}
+        if num_beams == 0 or num_planets == 0:
+            return
+
+        # --- 各恒星から見た惑星の距離と角度（ティックの開始時と終了時） ---
+        d0, d1, theta0, dtheta = self._planet_tracks()
+
+        # --- 1. 惑星をセルに登録（恒星 × 惑星 の組ごと） ---
+        last_ring = self.num_rings - 1
+        owner_star = np.repeat(np.arange(len(stars)), num_planets)
+        near = np.minimum(d0, d1)
+        far = np.maximum(d0, d1)
+        ring_lo = np.minimum(near // ARENA_RING_WIDTH, last_ring).astype(np.int64)
+        ring_hi = np.minimum(far // ARENA_RING_WIDTH, last_ring).astype(np.int64)
+        sector_lo = np.floor(np.minimum(theta0, theta0 + dtheta) / self.sector_angle).astype(np.int64)
+        sector_hi = np.floor(np.maximum(theta0, theta0 + dtheta) / self.sector_angle).astype(np.int64)
+        planet_keys, planet_owner = self._cell_keys(
+            owner_star, ring_lo, ring_hi - ring_lo + 1,
+            sector_lo, np.minimum(sector_hi - sector_lo + 1, ARENA_SECTORS))
+        order = np.argsort(planet_keys, kind='stable')
+        planet_keys = planet_keys[order]
+        planet_owner = planet_owner[order]
+
+        # --- 2. 光線が覆うセルから候補の惑星を引く ---
+        # 光線は広がる一方なので、帯に入っている時刻の惑星までの距離は r0 - reach より大きい
+        # （_narrow_phase が使う距離の下限。角度のマージンは距離が小さいほど大きいので、これで見積もれば取りこぼさない）
+        reach = self.reach
+        r0 = beams['prev_radius']
+        r1 = beams['radius']
+        inner = r0 - reach
+        outer = r1 + reach
+        # 発射した恒星から見て、どの惑星の距離の範囲にもかからない光線は、セルを列挙する前に除く
+        beam_star = beams['star'].astype(np.int64)
+        near_by_star = near.reshape(len(stars), num_planets)[beam_star]
+        far_by_star = far.reshape(len(stars), num_planets)[beam_star]
+        overlaps = (outer[:, None] > near_by_star) & (inner[:, None] < far_by_star)
+        queried = np.flatnonzero(overlaps.any(axis=1))
+        if len(queried) == 0:
+            return
+
+        ring_lo = np.clip(inner[queried] // ARENA_RING_WIDTH, 0, last_ring).astype(np.int64)
+        ring_hi = np.clip(outer[queried] // ARENA_RING_WIDTH, 0, last_ring).astype(np.int64)
+        half = self.ARC_RANGE / 2 + angle_margins(inner[queried], PLANET_SIZE)
+        facing = -beams['angle'][queried] # 光線の弧の中心が向いている方向（画面の座標系）
+        sector_lo = np.floor((facing - half) / self.sector_angle).astype(np.int64)
+        sector_hi = np.floor((facing + half) / self.sector_angle).astype(np.int64)
+        query_keys, query_owner = self._cell_keys(
+            beam_star[queried], ring_lo, ring_hi - ring_lo + 1,
+            sector_lo, np.minimum(sector_hi - sector_lo + 1, ARENA_SECTORS))
+        query_beam = queried[query_owner]
+
+        left = np.searchsorted(planet_keys, query_keys, 'left')
+        counts = np.searchsorted(planet_keys, query_keys, 'right') - left
+        pair_beam = np.repeat(query_beam, counts)
+        pair_owner = planet_owner[np.repeat(left, counts) + _ramp(counts)]
+        # 惑星は複数のセルに登録されるので、同じ組は1つにまとめる
+        pairs = np.unique(pair_beam * len(d0) + pair_owner)
+        pair_beam = pairs // len(d0)
+        pair_owner = pairs % len(d0)
+        self.collision_stats['cells'] = len(query_keys)
+        self.collision_stats['pairs'] = len(pairs)
+        if len(pairs) == 0:
+            return
+
+        # --- 3. 連続的な判定 ---
+        hit = self._narrow_phase(pair_beam, pair_owner, d0, d1, theta0, dtheta)
+        hit_beams = np.unique(pair_beam[hit])
+        self.collision_stats['hits'] = len(hit_beams)
+        if len(hit_beams) == 0:
+            return
+        self.kill_count += len(hit_beams)
+        self.score -= 200 * len(hit_beams)
+        self.corpses.add(
+            len(hit_beams),
+            x=beams['x'][hit_beams], y=beams['y'][hit_beams],
+            angle=beams['angle'][hit_beams], radius=beams['radius'][hit_beams],
+            life=self.CORPSE_DURATION,
+        )
+        survived = np.ones(num_beams, dtype=bool)
+        survived[hit_beams] = False
+        beams.keep(survived)
+
+    # --- 描画 ---
+
+    def _arc_polylines(self, x, y, angle, radius, width, groups, num_groups):
+        """
+        円弧を折れ線で近似し、画面にかかるものをグループ（明るさの段階など）ごとのリストにまとめる
+        角度は pygame.draw.arc と同じ向き（反時計回り）
+        頂点は (区間数, グループ) ごとに1回の tolist() で pygame に渡せるリストにする
+        :param width: 線の幅（画面にかかるかの判定に使う）
+        :param groups: 各円弧のグループの番号 (0 ~ num_groups-1)
+        :param num_groups: グループの数
+        :return: グループごとの折れ線のリスト
+        """
+        polylines = [[] for _ in range(num_groups)]
+
+        # 先に弧の中点のまわりで絞り込む（弧は中点から 半径 * 2sin(角度範囲/4) 以内にある）
+        cos = np.cos(angle)
+        sin = np.sin(angle)
+        mid_x = x + radius * cos
+        mid_y = y - radius * sin
+        extent = radius * (2 * math.sin(self.ARC_RANGE / 4)) + width
+        arcs = np.flatnonzero((mid_x + extent >= 0) & (mid_x - extent < SCREEN_WIDTH) &
+                              (mid_y + extent >= 0) & (mid_y - extent < SCREEN_HEIGHT))
+        # 区間数、グループの順に並べ、区切りを searchsorted で求める
+        tiers = np.searchsorted(self.ARC_LOD_RADII, radius[arcs], side='right')
+        order = np.lexsort((groups[arcs], tiers))
+        arcs = arcs[order]
+        tier_bounds = np.searchsorted(tiers[order], np.arange(len(self.ARC_SEGMENTS) + 1)).tolist()
+
+        for tier, (rot_cos, rot_sin) in enumerate(self.arc_rotations):
+            selected = arcs[tier_bounds[tier]:tier_bounds[tier + 1]]
+            if len(selected) == 0:
+                continue
+            r_cos = (radius[selected] * cos[selected])[:, None]
+            r_sin = (radius[selected] * sin[selected])[:, None]
+            points = np.empty((len(selected), len(rot_cos), 2))
+            xs = points[..., 0]
+            ys = points[..., 1]
+            np.add(x[selected, None], r_cos * rot_cos - r_sin * rot_sin, out=xs)
+            np.subtract(y[selected, None], r_sin * rot_cos + r_cos * rot_sin, out=ys)
+            on_screen = np.flatnonzero((xs.max(axis=1) >= -width) & (xs.min(axis=1) < SCREEN_WIDTH + width) &
+                                       (ys.max(axis=1) >= -width) & (ys.min(axis=1) < SCREEN_HEIGHT + width))
+            points = points[on_screen]
+            bounds = np.searchsorted(groups[selected[on_screen]], np.arange(num_groups + 1)).tolist()
+            for group in range(num_groups):
+                if bounds[group + 1] > bounds[group]:
+                    polylines[group].extend(points[bounds[group]:bounds[group + 1]].tolist())
+        return polylines
+
+    def _draw_faded_arcs(self, renderer, layer, arcs, width):
+        """
+        残り寿命の割合に応じて暗くした円弧を、(色, 明るさの段階) ごとにまとめて描画する
+        :param arcs: (色, x, y, angle, radius, 残り寿命の割合) のリスト。頂点は1回でまとめて求め、リストの順に重ねて描く
+        """
+        colors = [arc[0] for arc in arcs]
+        x, y, angle, radius, ratio = (np.concatenate(column) for column in zip(*(arc[1:] for arc in arcs)))
+        if len(x) == 0:
+            return
+        levels = np.minimum((ratio * self.FADE_LEVELS).astype(np.int64), self.FADE_LEVELS - 1)
+        levels += self.FADE_LEVELS * np.repeat(np.arange(len(arcs)), [len(arc[1]) for arc in arcs])
+        groups = self._arc_polylines(x, y, angle, radius, width, levels, self.FADE_LEVELS * len(arcs))
+        for group, polylines in enumerate(groups):
+            if polylines:
+                color = colors[group // self.FADE_LEVELS]
+                scale = (group % self.FADE_LEVELS + 1) / self.FADE_LEVELS
+                renderer.lines(layer, tuple(int(c * scale) for c in color), polylines, width)
+
+    def draw(self, renderer):
+        """
+        光線・死体・恒星・惑星を描画する
+        :param renderer: 描画命令を受け付けるRenderBackend
+        """
+        # 光線と、その上に死体
+        beams, corpses = self.beams, self.corpses
+        self._draw_faded_arcs(renderer, 'beams', [
+            (WHITE, beams['x'], beams['y'], beams['angle'], beams['radius'],
+             1.0 - beams['radius'] / ARENA_BEAM_MAX_RADIUS),
+            (RED, corpses['x'], corpses['y'], corpses['angle'], corpses['radius'],
+             corpses['life'] / self.CORPSE_DURATION),
+        ], self.BEAM_DRAW_WIDTH)
+
+        # 恒星本体と縁
+        stars = self.stars
+        for x, y in zip(stars['x'].tolist(), stars['y'].tolist()):
+            renderer.circle('bodies', BLACK, (x, y), ARENA_STAR_SIZE / 2)
+            renderer.circle('bodies', SUN_ORANGE, (x, y), ARENA_STAR_SIZE / 2, CIRCLE_WIDTH)
+        # 砲台（恒星ごとに3つ）はまとめて折れ線で描く
+        cannons = np.arange(self.CANNONS)
+        angles = (stars['angle'][:, None] + (TWO_PI / self.CANNONS) * cannons[None, :]).ravel()
+        polylines, = self._arc_polylines(np.repeat(stars['x'], self.CANNONS), np.repeat(stars['y'], self.CANNONS),
+                                         angles, stars['cannon_radii'].ravel(), self.BEAM_WIDTH,
+                                         np.zeros(len(angles), dtype=np.int64), 1)
+        renderer.lines('bodies', SUN_ORANGE, polylines, self.BEAM_WIDTH)
+
+        # 惑星
+        xs, ys = self.planet_positions(self.planets['angle'])
+        for x, y in zip(xs.astype(int).tolist(), ys.astype(int).tolist()):
+            renderer.circle('bodies', BLACK, (x, y), PLANET_SIZE)
+            renderer.circle('bodies', EARTH_BLUE, (x, y), PLANET_SIZE, CIRCLE_WIDTH)
@@ -0,0 +1,115 @@
+# mode/input.py
+
+import time
+
+import pygame
+
+# 入力のタイムラインが扱うイベント（フレームの待ち時間にも、これだけを先にキューから取り出す）
+INPUT_EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+class InputTimeline:
+    """
+    時刻つきの入力イベントから、操作（左・右）が押されていた時間を積分するクラス
+    毎フレーム get_pressed() で状態を読む代わりに KEYDOWN/KEYUP とマウスのイベントで状態を切り替え、
+    latch() でシミュレーションの直前までの区間の平均の加速方向を返す。
+    1フレームより短い押下も、押されていた時間の割合として方向に反映される。
+    """
+
+    # キー -> 操作名
+    KEYS = {pygame.K_LEFT: 'left', pygame.K_RIGHT: 'right'}
+
+    def __init__(self, buttons=None):
+        """
+        InputTimelineオブジェクトの初期化
+        :param buttons: 操作名 -> マウスで押せるボタン（is_clicked(pos) を持つ）の辞書
+        """
+        self.buttons = buttons or {}
+        # 入力から画面表示までの遅延を計測するLatencyProbe（Noneなら計測しない）
+        self.probe = None
+        self.reset()
+
+    def reset(self, now=None):
+        """
+        積分の区間を now から始め直す（シーンに入るとき）
+        押しっぱなしのキーは引き継ぐ
+        :param now: 区間の開始時刻[s]（time.perf_counter() の値。Noneなら現在時刻）
+        """
+        pressed = pygame.key.get_pressed()
+        self.keys_held = {control for key, control in self.KEYS.items() if pressed[key]}
+        self.mouse_down = False
+        self.pointer_control = None # マウスで押しているボタンの操作名
+
+        now = time.perf_counter() if now is None else now
+        self._segment_start = now # 現在の方向になった時刻
+        self._latch_time = now # 前回 latch() した時刻
+        self._integral = 0.0 # 前回の latch() から _segment_start までの方向の積分[s]
+        self._pending = [] # 前回の latch() 以降に方向を変えたイベントの時刻
+
+    def is_held(self, control):
+        """操作が押されているか"""
+        return control in self.keys_held or control == self.pointer_control
+
+    def direction(self):
+        """現在の加速方向 (-1: 右, 0: 無し, 1: 左)。両方押されているときは左を優先する"""
+        if self.is_held('left'):
+            return 1
+        if self.is_held('right'):
+            return -1
+        return 0
+
+    def _hit(self, pos):
+        """マウスの座標にあるボタンの操作名（なければNone）"""
+        for control, button in self.buttons.items():
+            if button.is_clicked(pos):
+                return control
+        return None
+
+    def record(self, event):
+        """
+        入力イベントを記録する
+        :param event: Pygameのイベント（Game が付けた timestamp 属性があればその時刻に起きたものとする）
+        """
+        before = self.direction()
+        if event.type == pygame.KEYDOWN and event.key in self.KEYS:
+            self.keys_held.add(self.KEYS[event.key])
+        elif event.type == pygame.KEYUP and event.key in self.KEYS:
+            self.keys_held.discard(self.KEYS[event.key])
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.mouse_down = True
+            self.pointer_control = self._hit(event.pos)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.mouse_down = False
+            self.pointer_control = None
+        elif event.type == pygame.MOUSEMOTION and self.mouse_down:
+            # 押したままボタンの外へ出たり、外から入ったりした場合
+            self.pointer_control = self._hit(event.pos)
+        else:
+            return
+
+        if self.direction() == before:
+            return
+        # 方向が変わった時刻で区間を区切る（latch() より前の時刻は latch() の時刻に丸める）
+        timestamp = max(getattr(event, 'timestamp', None) or time.perf_counter(), self._segment_start)
+        self._integral += before * (timestamp - self._segment_start)
+        self._segment_start = timestamp
+        self._pending.append(timestamp)
+
+    def latch(self, now=None):
+        """
+        前回の latch() から now までの平均の加速方向を返し、次の区間を始める
+        シミュレーションを進める直前に呼ぶ
+        :param now: 区間の終了時刻[s]（Noneなら現在時刻）
+        :return: 加速方向 (-1.0 ~ 1.0)。区間のあいだ同じ方向なら -1, 0, 1 のいずれか
+        """
+        now = max(time.perf_counter() if now is None else now, self._segment_start)
+        current = self.direction()
+        span = now - self._latch_time
+        integral = self._integral + current * (now - self._segment_start)
+        direction = integral / span if span > 0 else current
+
+        self._integral = 0.0
+        self._segment_start = self._latch_time = now
+        if self.probe is not None and self._pending:
+            self.probe.latched(self._pending)
+        self._pending = []
+        return direction
@@ -0,0 +1,130 @@
+# mode/play/collision.py
+#
+# 光線（広がるリング状の弧）と惑星（公転する円）の連続的な衝突判定
+# 1ティックの間に光線の半径は prev_radius -> radius、惑星の角度は prev_angle -> angle へ
+# 直線的に動くものとして、ティック全体の区間 t ∈ (0, 1] で重なりを調べる。
+# 半径方向はフレームごとの位置、角度方向は区間全体を連続的に調べる。
+# ティック終了時の位置だけを見る判定と違い、ティックレートを下げても惑星が光線の弧をすり抜けない。
+
+import math
+
+import numpy as np
+
+TWO_PI = 2 * math.pi
+
+def wrap_angle(angle):
+    """角度を [-π, π) に収める"""
+    return (angle + math.pi) % TWO_PI - math.pi
+
+def angle_margin(orbit_radius, size):
+    """
+    惑星の大きさによる角度のマージン（中心から見た惑星の半径の角度）
+    :param orbit_radius: 惑星の公転半径
+    :param size: 惑星の大きさ
+    """
+    if orbit_radius > size:
+        return math.asin(size / orbit_radius)
+    return math.pi
+
+def in_band(radius, orbit_radius, reach):
+    """半径 radius の光線が、公転半径 orbit_radius の帯（±reach）に入っているか"""
+    return radius - reach < orbit_radius < radius + reach
+
+def band_interval(beam, orbit_radius, reach, steps):
+    """
+    ティック内で光線が惑星の公転軌道の帯（±reach）に入っている区間
+    区間の端はフレーム（ティックを steps 等分した時刻）に揃える。光線は1フレームごとに
+    BEAM_SPEED ずつ広がるものとして扱うので、steps=1（TICK_RATE == FPS）ではティック終了時の判定と一致する。
+    :param beam: Beamオブジェクト
+    :param orbit_radius: 惑星の公転半径
+    :param reach: 光線の幅 + 惑星の大きさ
+    :param steps: 1ティックのフレーム数
+    :return: (lo, hi)（0 < lo <= hi <= 1）。帯に入らなければ None
+    """
+    r0 = beam.prev_radius
+    step = (beam.radius - r0) / steps # 1フレームで広がる量
+    if step == 0:
+        # 発射直後など、このティックで動いていない光線は終了時の位置だけを見る
+        return (1.0, 1.0) if in_band(beam.radius, orbit_radius, reach) else None
+
+    # 帯に入っている時刻（フレーム単位, 開区間）
+    enter = (orbit_radius - reach - r0) / step
+    leave = (orbit_radius + reach - r0) / step
+    if enter > leave:
+        enter, leave = leave, enter
+    first = max(math.floor(enter) + 1, 1)
+    last = min(math.ceil(leave) - 1, steps)
+    if first > last:
+        return None
+    return first / steps, last / steps
+
+def band_intervals(r0, r1, d0, d1, reach, steps):
+    """
+    band_interval の配列版（光線と惑星の組ごとにまとめて求める）
+    光線の中心が公転の中心と異なり、光線の中心から惑星までの距離もティック中に d0 -> d1 と変わる場合に使う。
+    区間の端をフレームに揃える規則と、このティックで相対的に動いていない組の扱いは band_interval と同じ。
+    :param r0: ティック開始時の光線の半径の配列
+    :param r1: ティック終了時の光線の半径の配列
+    :param d0: ティック開始時の光線の中心から惑星までの距離の配列
+    :param d1: ティック終了時の光線の中心から惑星までの距離の配列
+    :param reach: 光線の幅 + 惑星の大きさ
+    :param steps: 1ティックのフレーム数
+    :return: (lo, hi, 帯に入るか) の配列。帯に入る組は 0 < lo <= hi <= 1
+    """
+    rel0 = r0 - d0 # 光線の半径と惑星までの距離の差（ティック開始時）
+    step = ((r1 - r0) - (d1 - d0)) / steps # 1フレームでの差の変化
+    moving = step != 0
+    safe_step = np.where(moving, step, 1.0)
+    enter = (-reach - rel0) / safe_step
+    leave = (reach - rel0) / safe_step
+    first = np.maximum(np.floor(np.minimum(enter, leave)) + 1, 1)
+    last = np.minimum(np.ceil(np.maximum(enter, leave)) - 1, steps)
+    # 動いていない組は終了時の位置だけを見る
+    still_inside = np.abs(r1 - d1) < reach
+    lo = np.where(moving, first / steps, 1.0)
+    hi = np.where(moving, last / steps, 1.0)
+    inside = np.where(moving, first <= last, still_inside)
+    return lo, hi, inside
+
+def angle_margins(distance, size):
+    """angle_margin の配列版"""
+    return np.where(distance > size, np.arcsin(size / np.maximum(distance, size)), math.pi)
+
+def sweeps_angle(planet, beam, lo, hi, margin):
+    """
+    区間 [lo, hi] の間に惑星が光線の弧（±マージン）の角度に入るか
+    :param planet: Planetオブジェクト
+    :param beam: Beamオブジェクト
+    :param lo: 区間の始まり（ティック内の割合, lo == hi なら時刻 hi の1点）
+    :param hi: 区間の終わり（ティック内の割合）
+    :param margin: angle_margin で求めた角度のマージン
+    """
+    a0 = planet.prev_angle
+    da = planet.angle - a0
+    # 光線の角度は画面の向きが逆なので、惑星の角度に足したものが0に近いほど正面
+    d_lo = wrap_angle(a0 + da * lo + beam.angle)
+    d_hi = d_lo + da * (hi - lo)
+    low, high = min(d_lo, d_hi), max(d_lo, d_hi)
+
+    # 区間が 0 (または ±2π) を含めば正面を通過している
+    if low <= 0 <= high or low <= TWO_PI <= high or low <= -TWO_PI <= high:
+        nearest = 0.0
+    else:
+        nearest = min(abs(d_lo), abs(wrap_angle(d_hi)))
+    return nearest < beam.arc_range / 2 + margin
+
+def check_beam(planet, beam, margin, steps=1):
+    """
+    光線1本の判定
+    :param planet: Planetオブジェクト
+    :param beam: Beamオブジェクト
+    :param margin: angle_margin で求めた角度のマージン
+    :param steps: 1ティックのフレーム数 (TICK_STEPS)
+    :return: (衝突したか, ティック終了時に帯の中にいるか)
+    """
+    reach = beam.width + planet.size
+    interval = band_interval(beam, planet.radius, reach, steps)
+    if interval is None:
+        return False, False
+    lo, hi = interval
+    return sweeps_angle(planet, beam, lo, hi, margin), in_band(beam.radius, planet.radius, reach)
@@ -1,34 +1,41 @@
 # mode/play/play.py
 
 import pygame
-import math
+import os
+import random
 
 
 from config import *
+from capture.replay import ReplayLog
 from entities.planet import Planet
 from entities.star import Star
 from entities.beam import BeamCorpse
+from mode.input import InputTimeline
+from mode.play.collision import angle_margin, check_beam
 from mode.play.ui.button import Button
 from mode.play.ui.hud import HUD
+from mode.scene import Scene
+from mode.system.ui.system_button import System_Button
 
-class Play:
+class Play(Scene):
     """
     PLAYモードを管理するクラス
     """
 
-    def __init__(self, screen, clock):
+    def __init__(self, renderer, clock, assets):
         """
         Playオブジェクトの初期化
+        リスタートのたびに作り直さなくてよいオブジェクトはここで一度だけ生成する
+        :param renderer: 描画命令を受け付けるRenderBackend
+        :param assets: フォントやボタン画像を共有するAssetCache
         """
        
-        # 画面の設定
-        self.screen = screen
+        # 描画先の設定
+        self.renderer = renderer
         # 時間管理用のClockオブジェクト
         self.clock = clock
-
-    def initialize_play_state(self):
-        """ゲームの状態を初期化する。"""
-        self.start_time = pygame.time.get_ticks() # 経過時間の初期化
+        # スペースキーハンドラを生成
+        self.system_button = System_Button()
 
         # --- オブジェクトの生成 ---
         # Planetオブジェクトを生成
@@ -36,39 +43,104 @@ class Play:
         # Starオブジェクトを生成
         self.star = Star(CENTER_POS, STAR_SIZE)
         # 円形ボタンを画面左右中心に配置
-        self.left_button = Button(SCREEN_WIDTH / 2 - 100, SCREEN_HEIGHT - 80, BUTTON_RADIUS, 'left')
-        self.right_button = Button(SCREEN_WIDTH / 2 + 100, SCREEN_HEIGHT - 80, BUTTON_RADIUS, 'right')
+        self.left_button = Button(SCREEN_WIDTH / 2 - 100, SCREEN_HEIGHT - 80, BUTTON_RADIUS, 'left', assets)
+        self.right_button = Button(SCREEN_WIDTH / 2 + 100, SCREEN_HEIGHT - 80, BUTTON_RADIUS, 'right', assets)
         # HUDオブジェクトを生成
-        self.hud = HUD()
+        self.hud = HUD(assets)
+        # キーと左右のボタンの入力を時刻つきで記録し、ティックごとに押されていた時間を積分する
+        self.input = InputTimeline({'left': self.left_button, 'right': self.right_button})
+
+        # リプレイログの保存先（Noneなら記録しない）
+        self.replay_dir = None
+        self.replay = None
+        self.replay_count = 0
+        # Trueなら経過時間を実時間ではなくティック数から求める（オフライン描画用）
+        self.use_tick_clock = False
+        # ラウンドと光線の記録先のTelemetrySink（Noneなら記録しない）
+        self.telemetry = None
+        # プレイ中の状態を配信するSpectatorServer（Noneなら配信しない）
+        self.spectator = None
+
+        self.initialize_play_state()
+
+    def enter(self):
+        """プレイモードに入るたびにラウンドを初期化する"""
+        self.initialize_play_state()
+
+    def exit(self):
+        """プレイモードを抜けるときにラウンドの結果とリプレイログを保存する"""
+        if self.telemetry is not None and self.telemetry.current_run_id is not None:
+            self.telemetry.end_run(self.tick, self.elapsed_time(), self.score, self.kill_count, self.dodge_count)
+        if self.replay is not None:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            self.replay.save(os.path.join(self.replay_dir, f"replay_{self.replay_count:04d}.json"))
+            self.replay_count += 1
+            self.replay = None
+
+    def handle_event(self, event):
+        """操作の入力を記録し、スペースキーでシステム画面に戻る"""
+        self.input.record(event)
+        if self.system_button.is_pressed(event):
+            return 'system'
+        return None
+
+    def initialize_play_state(self, seed=None):
+        """
+        ゲームの状態を初期化する。可変な状態のみをリセットし、オブジェクトは再利用する。
+        :param seed: ラウンドの乱数シード（リプレイの再生用）。Noneでリプレイを記録する場合は新しく生成する
+        """
+        self.start_time = pygame.time.get_ticks() # 経過時間の初期化
+        self.tick = 0 # ラウンド開始からのティック数
+        self.frame_count = 0 # 前のティックから進んだフレーム数
+
+        # リプレイを再現できるよう、ラウンドの乱数シードを固定する
+        if seed is None and self.replay_dir is not None:
+            self.replay = ReplayLog()
+            seed = self.replay.seed
+        if seed is not None:
+            random.seed(seed)
+
+        self.planet.reset(PLANET_INITIAL_ANGLE)
+        self.star.reset()
+        self.input.reset()
         self.left_active = False
         self.right_active = False
         self.score = 0
         self.kill_count = 0
+        self.dodge_count = 0
         self.corpses = []
 
+        if self.telemetry is not None:
+            self.telemetry.begin_run()
+
     def update(self):
         """
         ゲーム内の各オブジェクトの状態を更新する
         """
         # --- 惑星の操作（キーボードとマウスの両方に対応） ---
-        keys = pygame.key.get_pressed()
-        mouse_buttons = pygame.mouse.get_pressed()
-        mouse_pos = pygame.mouse.get_pos()
-
-        # 左方向への加速判定 (左キー or 左ボタンクリック)
-        self.left_active = keys[pygame.K_LEFT] or \
-                                (mouse_buttons[0] and self.left_button.is_clicked(mouse_pos))
-        # 右方向への加速判定 (右キー or 右ボタンクリック)
-        self.right_active = keys[pygame.K_RIGHT] or \
-                                (mouse_buttons[0] and self.right_button.is_clicked(mouse_pos))
-
-        # 加速方向を決定
-        direction = 0
-        if self.left_active:
-            direction = 1
-        elif self.right_active:
-            direction = -1
+        # 押されているかどうかはイベントで更新済み（ボタンの表示用）
+        self.left_active = self.input.is_held('left')
+        self.right_active = self.input.is_held('right')
+
+        # 描画は毎フレーム、シミュレーションは TICK_STEPS フレームに1回（TICK_RATE）進める
+        self.frame_count += 1
+        if self.frame_count < TICK_STEPS:
+            return
+        self.frame_count = 0
 
+        # シミュレーションの直前に、前のティックからの入力を確定する
+        # 加速方向はティックのあいだ押されていた時間の割合（1フレームより短い押下も反映される）
+        direction = self.input.latch()
+
+        if self.replay is not None:
+            self.replay.record(direction)
+        self.step(direction)
+
+    def step(self, direction):
+        """
+        入力方向を受け取り、1ティック分シミュレーションを進める
+        :param direction: 惑星の加速方向 (-1.0 ~ 1.0。-1: 右, 0: 無し, 1: 左)
+        """
         # 決定した方向を渡して惑星の状態を更新
         self.planet.update(direction)
         # 恒星の状態をAIに基づいて更新
@@ -78,6 +150,20 @@ class Play:
 
         # 衝突の判定とビームの削除
         self.check_collisions()
+        self.tick += 1
+
+        if self.spectator is not None:
+            self.spectator.publish(self)
+
+    def elapsed_time(self):
+        """ラウンド開始からの経過時間[ms]"""
+        if self.use_tick_clock:
+            return self.tick * 1000 // TICK_RATE
+        return pygame.time.get_ticks() - self.start_time
+
+    def live_entities(self):
+        """生きているエンティティの数（メモリ計測用）"""
+        return {'beams': len(self.star.beams), 'corpses': len(self.corpses)}
 
     def update_corpses(self):
         """光線の死体を更新し、寿命が尽きたものを削除する"""
@@ -86,36 +172,30 @@ class Play:
         self.corpses = [c for c in self.corpses if c.is_alive()]
 
     def check_collisions(self):
-        """惑星と光線の衝突を判定する"""
-        planet_angle = self.planet.angle
+        """惑星と光線の衝突を、ティックの間の動きも含めて判定する（mode/play/collision.py）"""
         planet_orbit_radius = self.planet.radius
-        planet_size = self.planet.size
 
         # 衝突判定のための角度のマージンを計算
-        if planet_orbit_radius > planet_size:
-            angle_margin = math.asin(planet_size / planet_orbit_radius)
-        else:
-            angle_margin = math.pi
+        margin = angle_margin(planet_orbit_radius, self.planet.size)
 
         # ビームと惑星の衝突を判定し、衝突したビームを死体リストに追加し、生き残ったビームはリストに保持
         surviving_beams = [] # 生き残ったビームのリスト
         for beam in self.star.beams:
-            beam_front_radius = beam.radius + beam.width + self.planet.size 
-            beam_back_radius = max(0, beam.radius - beam.width - self.planet.size)
-
-            collided = False
-            if beam_back_radius < planet_orbit_radius < beam_front_radius:
-                angle_diff = (planet_angle + beam.angle + math.pi) % (2 * math.pi) - math.pi
-
-                if abs(angle_diff) < beam.arc_range / 2 + angle_margin:
-                    self.kill_count += 1
-                    self.score -= 200
-                    # 衝突したビームの死体を追加
-                    self.corpses.append(BeamCorpse(beam.center_pos, beam.angle, beam.arc_range, beam.radius, beam.width))
-                    collided = True
-            elif beam.radius > planet_orbit_radius and not beam.dodged:
+            collided, inside = check_beam(self.planet, beam, margin, TICK_STEPS)
+
+            if collided:
+                self.kill_count += 1
+                self.score -= 200
+                # 衝突したビームの死体を追加
+                self.corpses.append(BeamCorpse(beam.center_pos, beam.angle, beam.arc_range, beam.radius, beam.width))
+                if self.telemetry is not None:
+                    self.telemetry.record_event(self.tick, True, beam.cannon, beam.angle, self.planet.speed)
+            elif not inside and beam.radius > planet_orbit_radius and not beam.dodged:
                 self.score += 10
+                self.dodge_count += 1
                 beam.dodged = True
+                if self.telemetry is not None:
+                    self.telemetry.record_event(self.tick, False, beam.cannon, beam.angle, self.planet.speed)
             
             if not collided:
                 # 生き残ったビームとしてリストに追加
@@ -130,13 +210,12 @@ class Play:
         """
 
         for corpse in self.corpses:
-            corpse.draw(self.screen)
+            corpse.draw(self.renderer)
         
-        self.star.draw(self.screen)
-        self.planet.draw(self.screen)
+        self.star.draw(self.renderer)
+        self.planet.draw(self.renderer)
         
-        self.left_button.draw(self.screen, self.left_active)
-        self.right_button.draw(self.screen, self.right_active)
+        self.left_button.draw(self.renderer, self.left_active)
+        self.right_button.draw(self.renderer, self.right_active)
 
-        elapsed_time = pygame.time.get_ticks() - self.start_time
-        self.hud.draw(self.screen, self.planet.speed, self.planet.actual_acceleration, self.kill_count, self.score, elapsed_time)
+        self.hud.draw(self.renderer, self.planet.speed, self.planet.actual_acceleration, self.kill_count, self.score, self.elapsed_time())
@@ -1,29 +1,33 @@
 # mode/play/ui/button.py
 
 import pygame
-import math
 from config import WHITE, BLACK
 
 class Button:
     """
     スタイリッシュな円形の矢印ボタンを表すクラス
     """
-    def __init__(self, center_x, center_y, radius, direction):
+    def __init__(self, center_x, center_y, radius, direction, assets):
         """
         Buttonオブジェクトの初期化
         :param center_x: ボタンの中心x座標
         :param center_y: ボタンの中心y座標
         :param radius: ボタンの半径
         :param direction: 矢印の向き ('left' or 'right')
+        :param assets: 事前描画したSurfaceを共有するAssetCache
         """
         self.center = (center_x, center_y)
         self.radius = radius
+        self.radius_squared = radius * radius # 当たり判定用（平方根を取らずに比較する）
         self.direction = direction
 
         # パフォーマンス向上のため、ボタンの画像を事前に生成
         # 通常状態（黒地に白マーク）とアクティブ状態（白地に黒マーク）の2種類
-        self.image_normal = self._create_surface(icon_color=WHITE, bg_color=BLACK)
-        self.image_active = self._create_surface(icon_color=BLACK, bg_color=WHITE)
+        # 同じ半径・向きのボタンは AssetCache で共有し、再生成しない
+        self.image_normal = assets.surface(('button', radius, direction, 'normal'),
+                                       lambda: self._create_surface(icon_color=WHITE, bg_color=BLACK))
+        self.image_active = assets.surface(('button', radius, direction, 'active'),
+                                       lambda: self._create_surface(icon_color=BLACK, bg_color=WHITE))
         self.rect = self.image_normal.get_rect(center=self.center)
 
     def _create_surface(self, icon_color, bg_color):
@@ -57,22 +61,24 @@ class Button:
         
         return surface
 
-    def draw(self, screen, is_active=False):
+    def draw(self, renderer, is_active=False):
         """
         ボタンを画面に描画する。アクティブ状態に応じて表示を切り替える。
-        :param screen: 描画対象のPygameスクリーンオブジェクト
+        :param renderer: 描画命令を受け付けるRenderBackend
         :param is_active: ボタンが押されている状態かどうか
         """
         if is_active:
-            screen.blit(self.image_active, self.rect)
+            renderer.blit('ui', self.image_active, self.rect)
         else:
-            screen.blit(self.image_normal, self.rect)
+            renderer.blit('ui', self.image_normal, self.rect)
 
     def is_clicked(self, pos):
         """
-        指定された座標がボタンの円形領域内にあるか判定する
+        指定された座標がボタンの円形領域内にあるか判定する（マウスのイベントのときだけ呼ばれる）
         :param pos: マウスのクリック座標 (x, y)
         :return: クリックされていればTrue, そうでなければFalse
         """
-        # 中心点とマウス位置の距離を計算し、半径と比較
-        return math.hypot(pos[0] - self.center[0], pos[1] - self.center[1]) <= self.radius
\ No newline at end of file
+        # 中心点とマウス位置の距離の2乗を、半径の2乗と比較
+        dx = pos[0] - self.center[0]
+        dy = pos[1] - self.center[1]
+        return dx * dx + dy * dy <= self.radius_squared
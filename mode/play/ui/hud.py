@@ -1,52 +1,42 @@
 # mode/play/ui/hud.py
 
-import pygame
 from config import *
 
 class HUD:
     """
     Heads-Up Display: ゲームの情報を画面に表示するクラス
     """
-    def __init__(self, font_size=30):
+    def __init__(self, assets, font_size=30):
         """
         HUDオブジェクトの初期化
+        :param assets: フォントを共有するAssetCache
         :param font_size: 表示するテキストのフォントサイズ
         """
         # システムに存在する等幅フォントを自動的に選択する
         # これにより、数字の幅が常に一定になり、表示のガタつきがなくなる
-        font_names = ['consolas', 'dejavusansmono', 'couriernew', 'monospace']
-        self.font = pygame.font.SysFont(font_names, font_size)  
+        self.font = assets.font(font_size)
         self.color = WHITE
 
-    def draw(self, screen, planet_speed, actual_planet_acceleration, kill_count, score, elapsed_time):        
+    def draw(self, renderer, planet_speed, actual_planet_acceleration, kill_count, score, elapsed_time):        
        """
        各種情報を画面に描画する
-       :param screen: 描画対象のPygameスクリーンオブジェクト
+       (文字列の描画結果は描画バックエンドがキャッシュする)
+       :param renderer: 描画命令を受け付けるRenderBackend
        :param ...: 表示する各種ゲームデータ
        """
 
        # --- 速度の表示 ---
        display_speed = planet_speed * 1000
-       speed_text = self.font.render(f"SPEED:{display_speed:+08.4f}", True, GREEN)
-       speed_rect = speed_text.get_rect(topright=(SCREEN_WIDTH - 10, 10))  
-       screen.blit(speed_text, speed_rect)  
+       speed_rect = renderer.text('hud', self.font, f"SPEED:{display_speed:+08.4f}", GREEN, topright=(SCREEN_WIDTH - 10, 10))
 
        # --- 経過時間の表示 ---
-       time_text = self.font.render(f"TIME: {elapsed_time / 1000:6.2f}s", True, GREEN)
-       time_rect = time_text.get_rect(topleft=(10, 10))
-       screen.blit(time_text, time_rect)
+       time_rect = renderer.text('hud', self.font, f"TIME: {elapsed_time / 1000:6.2f}s", GREEN, topleft=(10, 10))
 
        # --- 加速度の表示 ---
        display_accel = actual_planet_acceleration * 1000
-       accel_text = self.font.render(f"ACCEL:{display_accel:+08.4f}", True, GREEN)
-       accel_rect = accel_text.get_rect(topright=(SCREEN_WIDTH - 10, speed_rect.bottom + 5))
-       screen.blit(accel_text, accel_rect)
+       renderer.text('hud', self.font, f"ACCEL:{display_accel:+08.4f}", GREEN, topright=(SCREEN_WIDTH - 10, speed_rect.bottom + 5))
        
        # --- スコアと衝突回数の表示 ---
-       score_text = self.font.render(f"SCORE: {score}", True, GREEN)
-       score_rect = score_text.get_rect(topleft=(10, time_rect.bottom + 5))
-       screen.blit(score_text, score_rect)
+       score_rect = renderer.text('hud', self.font, f"SCORE: {score}", GREEN, topleft=(10, time_rect.bottom + 5))
 
-       kill_text = self.font.render(f"KILLED: {kill_count}", True, GREEN)
-       kill_rect = kill_text.get_rect(topleft=(10, score_rect.bottom + 5))
-       screen.blit(kill_text, kill_rect)
\ No newline at end of file
+       renderer.text('hud', self.font, f"KILLED: {kill_count}", GREEN, topleft=(10, score_rect.bottom + 5))
\ No newline at end of file
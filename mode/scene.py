@@ -0,0 +1,103 @@
+# mode/scene.py
+
+import time
+
+class Scene:
+    """
+    ゲームモード（シーン）の基底クラス
+    SceneManager に登録され、遷移時に enter / exit が呼ばれる
+    """
+
+    def enter(self):
+        """シーンに入るときに呼ばれる。可変な状態だけをリセットする。"""
+        pass
+
+    def exit(self):
+        """シーンから出るときに呼ばれる。"""
+        pass
+
+    def handle_event(self, event):
+        """
+        イベントを処理する
+        :param event: Pygameのイベント
+        :return: 遷移先のシーン名。遷移しない場合はNone
+        """
+        return None
+
+    def update(self):
+        """状態を更新する。サブクラスで実装。"""
+        raise NotImplementedError
+
+    def draw(self):
+        """描画する。サブクラスで実装。"""
+        raise NotImplementedError
+
+    def live_entities(self):
+        """
+        生きているエンティティの数（メモリ計測用）
+        :return: 種類 -> 数 の辞書
+        """
+        return {}
+
+class SceneManager:
+    """
+    登録されたシーンを切り替えて実行するクラス
+    シーン遷移（exit + enter）にかかった時間を計測して保持する
+    """
+
+    def __init__(self):
+        self.scenes = {} # シーン名 -> Sceneオブジェクト
+        self.current_name = None
+        self.current = None
+        # 遷移先のシーン名 -> 遷移時間[ms]のリスト
+        self.transition_times = {}
+
+    def register(self, name, scene):
+        """
+        シーンを登録する
+        :param name: シーン名
+        :param scene: Sceneオブジェクト
+        """
+        self.scenes[name] = scene
+
+    def change(self, name):
+        """
+        指定されたシーンへ遷移する
+        :param name: 遷移先のシーン名
+        :return: 遷移にかかった時間[ms]
+        """
+        start = time.perf_counter()
+
+        if self.current is not None:
+            self.current.exit()
+        self.current_name = name
+        self.current = self.scenes[name]
+        self.current.enter()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.transition_times.setdefault(name, []).append(elapsed_ms)
+        return elapsed_ms
+
+    def handle_event(self, event):
+        """現在のシーンにイベントを渡し、必要ならシーンを切り替える"""
+        next_name = self.current.handle_event(event)
+        if next_name is not None:
+            self.change(next_name)
+
+    def update(self):
+        """現在のシーンを更新する"""
+        self.current.update()
+
+    def draw(self):
+        """現在のシーンを描画する"""
+        self.current.draw()
+
+    def latency_report(self):
+        """
+        シーン遷移時間の集計を文字列で返す
+        :return: シーンごとの回数・平均・最大[ms]を並べた文字列
+        """
+        lines = ["scene transition latency:"]
+        for name, times in self.transition_times.items():
+            lines.append(f"  -> {name:<8} n={len(times):4d} avg={sum(times) / len(times):7.3f}ms max={max(times):7.3f}ms")
+        return "\n".join(lines)
@@ -3,26 +3,36 @@
 import pygame
 
 from config import *
+from mode.scene import Scene
 from mode.system.ui.system_button import System_Button
 
-class System:
+class System(Scene):
     """
     スタート画面を管理するクラス
     """
 
-    def __init__(self, screen):
+    def __init__(self, renderer, assets):
         """
         Startオブジェクトの初期化
+        :param renderer: 描画命令を受け付けるRenderBackend
+        :param assets: フォントを共有するAssetCache
         """
-        # 画面の設定
-        self.screen = screen
+        # 描画先の設定
+        self.renderer = renderer
         # スペースキーハンドラを生成
         self.system_button = System_Button()
         
         # フォントの準備
-        font_names = ['consolas', 'dejavusansmono', 'couriernew', 'monospace']
-        self.title_font = pygame.font.SysFont(font_names, 74)
-        self.prompt_font = pygame.font.SysFont(font_names, 36)
+        self.title_font = assets.font(74)
+        self.prompt_font = assets.font(36)
+
+    def handle_event(self, event):
+        """スペースキーでプレイモード、Aキーでアリーナモードへ遷移する"""
+        if self.system_button.is_pressed(event):
+            return 'play'
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+            return 'arena'
+        return None
         
     def update(self):
         """
@@ -36,11 +46,8 @@ class System:
         """
 
         # 画面中央にゲームタイトルを表示
-        title_text = self.title_font.render("ORBITAL SURVIVAL", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50))
-        self.screen.blit(title_text, title_rect)
+        title_rect = self.renderer.text('ui', self.title_font, "ORBITAL SURVIVAL", WHITE, center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50))
 
         # タイトルの下に "Press SPACE" を表示
-        prompt_text = self.prompt_font.render("PRESS SPACE TO PLAY", True, GREEN)
-        prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH / 2, title_rect.bottom + 30))
-        self.screen.blit(prompt_text, prompt_rect)
\ No newline at end of file
+        prompt_rect = self.renderer.text('ui', self.prompt_font, "PRESS SPACE TO PLAY", GREEN, center=(SCREEN_WIDTH / 2, title_rect.bottom + 30))
+        self.renderer.text('ui', self.prompt_font, "PRESS A FOR ARENA", GRAY, center=(SCREEN_WIDTH / 2, prompt_rect.bottom + 20))
@@ -0,0 +1,147 @@
+# render/backend.py
+
+# 描画レイヤー（手前に描かれるものほど後ろ）
+LAYERS = ('background', 'beams', 'bodies', 'ui', 'hud')
+
+# 起動時に選択できる描画バックエンド
+BACKENDS = ('surface', 'sdl2')
+
+class RenderBackend:
+    """
+    描画バックエンドの基底クラス
+    描画命令をレイヤーごとに溜め、flush() でレイヤー順に書き出す。
+    エンティティやUIはこのインターフェースだけを使って描画する。
+    """
+
+    def __init__(self):
+        """
+        RenderBackendオブジェクトの初期化
+        """
+        # レイヤー名 -> 描画命令のリスト
+        self._layers = {name: [] for name in LAYERS}
+
+        # 1フレームあたりの描画統計
+        self.draw_calls = 0 # 個別の描画呼び出し回数
+        self.blit_calls = 0 # まとめて行った blits の呼び出し回数
+        self.sprites = 0 # 描画したスプライトの数
+        self.last_frame_stats = {'draw_calls': 0, 'blit_calls': 0, 'sprites': 0}
+
+    def prepare_surface(self, surface):
+        """
+        キャッシュするSurfaceをバックエンドに適した形式に変換する。サブクラスで実装。
+        :param surface: 生成直後のSurface
+        :return: 変換後のSurface
+        """
+        raise NotImplementedError
+
+    def blit(self, layer, surface, dest):
+        """
+        Surfaceの描画を予約する。サブクラスで実装。
+        :param layer: 描画レイヤー名
+        :param surface: 描画するSurface
+        :param dest: 描画位置（座標またはRect）
+        """
+        raise NotImplementedError
+
+    def circle(self, layer, color, center, radius, width=0):
+        """
+        円の描画を予約する。サブクラスで実装。
+        :param layer: 描画レイヤー名
+        :param color: 円の色
+        :param center: 円の中心座標 (x, y)
+        :param radius: 円の半径
+        :param width: 線の幅（0なら塗りつぶし）
+        """
+        raise NotImplementedError
+
+    def arc(self, layer, color, center, radius, start_angle, end_angle, width):
+        """
+        円弧の描画を予約する。角度は pygame.draw.arc と同じ向き（反時計回り）。サブクラスで実装。
+        :param layer: 描画レイヤー名
+        :param color: 円弧の色
+        :param center: 円弧の中心座標 (x, y)
+        :param radius: 円弧の外側の半径
+        :param start_angle: 開始角度
+        :param end_angle: 終了角度
+        :param width: 線の幅（内側に向かって描く）
+        """
+        raise NotImplementedError
+
+    def lines(self, layer, color, polylines, width=1):
+        """
+        同じ色・幅の折れ線をまとめて描画予約する（大量の光線などを1命令で描くため）。サブクラスで実装。
+        :param layer: 描画レイヤー名
+        :param color: 線の色
+        :param polylines: 折れ線のリスト。各折れ線は頂点 (x, y) のシーケンス
+        :param width: 線の幅
+        """
+        raise NotImplementedError
+
+    def text(self, layer, font, text, color, **anchor):
+        """
+        文字列の描画を予約する。サブクラスで実装。
+        :param layer: 描画レイヤー名
+        :param font: 使用するフォント
+        :param text: 表示する文字列
+        :param color: 文字の色
+        :param anchor: Rectの位置指定（topleft=(x, y) など）
+        :return: 文字列が描画される矩形
+        """
+        raise NotImplementedError
+
+    def present(self):
+        """書き出したフレームを画面に表示する。サブクラスで実装。"""
+        raise NotImplementedError
+
+    def capture_surface(self):
+        """
+        flush() 済みのフレームを32bitのSurfaceとして返す（キャプチャ用）。サブクラスで実装。
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        予約された描画命令をレイヤー順に書き出し、描画統計を更新する
+        命令は (surface, dest) 形式のblitか、引数なしの描画関数
+        """
+        self.draw_calls = 0
+        self.blit_calls = 0
+        self.sprites = 0
+
+        for name in LAYERS:
+            commands = self._layers[name]
+            batch = []
+            for command in commands:
+                if isinstance(command, tuple):
+                    batch.append(command)
+                    continue
+                # 描画関数の前に溜まっているblitを書き出して、描画順を保つ
+                self._flush_batch(batch)
+                batch = []
+                command()
+                self.draw_calls += 1
+            self._flush_batch(batch)
+            commands.clear()
+
+        self.last_frame_stats = {'draw_calls': self.draw_calls, 'blit_calls': self.blit_calls, 'sprites': self.sprites}
+
+    def _flush_batch(self, batch):
+        """溜まっているblitを書き出す。サブクラスで実装。"""
+        raise NotImplementedError
+
+def create_backend(name, size, caption, accelerated=-1):
+    """
+    名前から描画バックエンドを生成する（ウィンドウの生成も行う）
+    :param name: バックエンド名 ('surface' or 'sdl2')
+    :param size: 画面サイズ (幅, 高さ)
+    :param caption: ウィンドウのタイトル
+    :param accelerated: sdl2のみ。-1: 自動, 0: ソフトウェアレンダラ, 1: ハードウェアレンダラ
+    :return: RenderBackendオブジェクト
+    """
+    if name == 'surface':
+        from render.surface_backend import SurfaceBackend
+        return SurfaceBackend(size, caption)
+    if name == 'sdl2':
+        from render.sdl2_backend import Sdl2Backend
+        return Sdl2Backend(size, caption, accelerated)
+    raise ValueError(f"unknown render backend: {name!r} (choose from {', '.join(BACKENDS)})")
@@ -0,0 +1,166 @@
+# render/sdl2_backend.py
+
+import math
+import weakref
+from collections import deque
+
+import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+
+from config import WHITE, BLACK
+from render.backend import RenderBackend
+
+class Sdl2Backend(RenderBackend):
+    """
+    pygame._sdl2.video の Renderer / Texture を使って描画するバックエンド
+    円・円弧・軌道の点・文字は白いテクスチャとしてキャッシュし、描画時に色付けと回転を行う。
+    accelerated=0 を指定すればSDLのソフトウェアレンダラで動作する（GPU不要）。
+    """
+
+    def __init__(self, size, caption, accelerated=-1):
+        """
+        Sdl2Backendオブジェクトの初期化
+        :param size: 画面サイズ (幅, 高さ)
+        :param caption: ウィンドウのタイトル
+        :param accelerated: -1: 自動, 0: ソフトウェアレンダラ, 1: ハードウェアレンダラ
+        """
+        super().__init__()
+        self.window = Window(caption, size=size)
+        self.renderer = Renderer(self.window, accelerated=accelerated)
+        self.renderer.draw_color = (*BLACK, 255)
+
+        self._surface_textures = weakref.WeakKeyDictionary() # Surface -> Texture
+        self._circles = {} # (半径, 幅) -> 白い円のテクスチャ
+        self._arcs = {} # (半径, 幅, 角度範囲) -> (白い円弧のテクスチャ, 切り出し矩形)
+        self._glyphs = {} # (フォント, 文字) -> 白い文字のテクスチャ
+
+    def prepare_surface(self, surface):
+        """Surfaceは描画時にテクスチャ化するので、ここでは変換しない"""
+        return surface
+
+    def blit(self, layer, surface, dest):
+        """Surfaceの描画を予約する。Surfaceごとにテクスチャを一度だけ生成する。"""
+        texture = self._surface_textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self._surface_textures[surface] = texture
+        if not isinstance(dest, pygame.Rect):
+            dest = pygame.Rect(dest, surface.get_size())
+        self._layers[layer].append((texture, dest, 0.0, None, WHITE))
+
+    def circle(self, layer, color, center, radius, width=0):
+        """円の描画を予約する。白い円のテクスチャを色付けして描画する。"""
+        radius = int(radius)
+        if radius < 1:
+            return
+        key = (radius, width)
+        texture = self._circles.get(key)
+        if texture is None:
+            surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, WHITE, (radius, radius), radius, width)
+            texture = Texture.from_surface(self.renderer, surface)
+            self._circles[key] = texture
+        dest = pygame.Rect(int(center[0]) - radius, int(center[1]) - radius, texture.width, texture.height)
+        self._layers[layer].append((texture, dest, 0.0, None, color))
+
+    def arc(self, layer, color, center, radius, start_angle, end_angle, width):
+        """
+        円弧の描画を予約する
+        0度方向に描いた白い円弧のテクスチャを、円の中心を軸に回転させて描画する
+        """
+        radius = int(radius)
+        arc_range = end_angle - start_angle
+        if radius < 1 or width < 1:
+            return
+        key = (radius, width, round(arc_range, 4))
+        entry = self._arcs.get(key)
+        if entry is None:
+            entry = self._create_arc_texture(radius, width, arc_range)
+            self._arcs[key] = entry
+        texture, crop = entry
+        if texture is None:
+            return
+
+        # 円を含む矩形の左上を基準に、切り出した部分の位置と回転軸を求める
+        left = int(center[0] - radius)
+        top = int(center[1] - radius)
+        dest = pygame.Rect(left + crop.x, top + crop.y, crop.width, crop.height)
+        origin = (center[0] - dest.x, center[1] - dest.y)
+        # pygameの角度は反時計回り、SDLの回転は時計回り（度）
+        angle = -math.degrees((start_angle + end_angle) / 2)
+        self._layers[layer].append((texture, dest, angle, origin, color))
+
+    def lines(self, layer, color, polylines, width=1):
+        """折れ線の描画を予約する（SDLの線は幅1のみなので、幅は無視する）"""
+        if not polylines:
+            return
+        renderer = self.renderer
+
+        def draw():
+            renderer.draw_color = (*color, 255)
+            # 線分の始点と終点を並べてから map で描く（線分ごとに Python のループを回すより速い）
+            starts = []
+            ends = []
+            for points in polylines:
+                starts += points[:-1]
+                ends += points[1:]
+            deque(map(renderer.draw_line, starts, ends), maxlen=0)
+            renderer.draw_color = (*BLACK, 255)
+        self._layers[layer].append(draw)
+
+    def text(self, layer, font, text, color, **anchor):
+        """文字列の描画を予約する。1文字ずつキャッシュしたテクスチャを並べて描画する。"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+
+        commands = self._layers[layer]
+        x = rect.x
+        for char in text:
+            key = (font, char)
+            texture = self._glyphs.get(key)
+            if texture is None:
+                texture = Texture.from_surface(self.renderer, font.render(char, True, WHITE))
+                self._glyphs[key] = texture
+            commands.append((texture, pygame.Rect(x, rect.y, texture.width, texture.height), 0.0, None, color))
+            x += texture.width
+        return rect
+
+    def flush(self):
+        """画面を消去してから、予約された描画命令を書き出す"""
+        self.renderer.clear()
+        super().flush()
+
+    def present(self):
+        """レンダラの内容を画面に表示する"""
+        self.renderer.present()
+
+    def capture_surface(self):
+        """レンダラの内容を読み出す（GPUからの読み戻しになるため、surfaceバックエンドより遅い）"""
+        return self.renderer.to_surface()
+
+    def _flush_batch(self, batch):
+        """溜まっているテクスチャを色付け・回転して描画する"""
+        if not batch:
+            return
+        for texture, dest, angle, origin, color in batch:
+            texture.color = color
+            if angle:
+                texture.draw(dstrect=dest, angle=angle, origin=origin)
+            else:
+                texture.draw(dstrect=dest)
+        self.blit_calls += 1
+        self.draw_calls += len(batch)
+        self.sprites += len(batch)
+
+    def _create_arc_texture(self, radius, width, arc_range):
+        """
+        0度方向を中心とした白い円弧のテクスチャを生成し、描画部分だけを切り出す
+        :return: (テクスチャ, 円を含む矩形内での切り出し矩形)。描画部分がなければテクスチャはNone
+        """
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.arc(surface, WHITE, surface.get_rect(), -arc_range / 2, arc_range / 2, width)
+        crop = surface.get_bounding_rect()
+        if crop.width == 0 or crop.height == 0:
+            return None, crop
+        return Texture.from_surface(self.renderer, surface.subsurface(crop)), crop
@@ -0,0 +1,109 @@
+# render/surface_backend.py
+
+from collections import OrderedDict
+
+import pygame
+
+from render.backend import RenderBackend
+
+def to_display_format(surface):
+    """
+    Surfaceを画面のピクセルフォーマットに変換する
+    SDLのソフトウェア描画では、未変換の per-pixel alpha の blit は数倍遅い
+    :param surface: 変換するSurface
+    :return: 変換済みのSurface
+    """
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+class SurfaceBackend(RenderBackend):
+    """
+    pygame.display のSurfaceにソフトウェア描画するバックエンド
+    連続するblitは1回の Surface.blits 呼び出しにまとめる
+    """
+
+    # 描画済み文字列のキャッシュ数の上限
+    TEXT_CACHE_SIZE = 64
+
+    def __init__(self, size, caption):
+        """
+        SurfaceBackendオブジェクトの初期化
+        :param size: 画面サイズ (幅, 高さ)
+        :param caption: ウィンドウのタイトル
+        """
+        super().__init__()
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+        self._circles = {} # (色, 半径, 幅) -> 円のスプライト
+        self._texts = OrderedDict() # (フォント, 色, 文字列) -> 文字列のスプライト（LRU）
+
+    def prepare_surface(self, surface):
+        """キャッシュするSurfaceを画面のピクセルフォーマットに変換する"""
+        return to_display_format(surface)
+
+    def blit(self, layer, surface, dest):
+        """Surfaceの描画を予約する（表示フォーマットに変換済みであること）"""
+        self._layers[layer].append((surface, dest))
+
+    def circle(self, layer, color, center, radius, width=0):
+        """円の描画を予約する。円は色・半径・幅ごとにスプライト化してキャッシュする。"""
+        radius = int(radius)
+        if radius < 1:
+            return
+        key = (color, radius, width)
+        sprite = self._circles.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius, width)
+            sprite = to_display_format(sprite)
+            self._circles[key] = sprite
+        self._layers[layer].append((sprite, (int(center[0]) - radius, int(center[1]) - radius)))
+
+    def arc(self, layer, color, center, radius, start_angle, end_angle, width):
+        """円弧の描画を予約する（半径や色が毎フレーム変わるため、スプライト化せず直接描画する）"""
+        rect = pygame.Rect(int(center[0] - radius), int(center[1] - radius), int(radius * 2), int(radius * 2))
+        self._layers[layer].append(lambda: pygame.draw.arc(self.screen, color, rect, start_angle, end_angle, width))
+
+    def lines(self, layer, color, polylines, width=1):
+        """折れ線の描画を予約する（まとめて1つの描画関数として書き出す）"""
+        if not polylines:
+            return
+        screen = self.screen
+        draw_lines = pygame.draw.lines
+
+        def draw():
+            for points in polylines:
+                draw_lines(screen, color, False, points, width)
+        self._layers[layer].append(draw)
+
+    def text(self, layer, font, text, color, **anchor):
+        """文字列の描画を予約する。同じ文字列は再描画せずキャッシュから使う。"""
+        key = (font, color, text)
+        sprite = self._texts.get(key)
+        if sprite is None:
+            sprite = font.render(text, True, color).convert_alpha()
+            self._texts[key] = sprite
+            if len(self._texts) > self.TEXT_CACHE_SIZE:
+                self._texts.popitem(last=False)
+        else:
+            self._texts.move_to_end(key)
+        rect = sprite.get_rect(**anchor)
+        self._layers[layer].append((sprite, rect))
+        return rect
+
+    def present(self):
+        """画面を更新する"""
+        pygame.display.flip()
+
+    def capture_surface(self):
+        """画面のSurfaceをそのまま返す（コピーしない）"""
+        return self.screen
+
+    def _flush_batch(self, batch):
+        """溜まっているblitを1回の blits 呼び出しで書き出す"""
+        if batch:
+            self.screen.blits(batch, doreturn=False)
+            self.blit_calls += 1
+            self.sprites += len(batch)
@@ -0,0 +1,103 @@
+# spectator/client.py
+# 観戦サーバーに接続して状態を復元する最小限のクライアント（ロビー画面や運営用ダッシュボードの土台）
+#   python -m spectator.client --port 8765
+
+import argparse
+import asyncio
+import sys
+
+from spectator.protocol import FRAME_HEADER, KEYFRAME, decode
+
+class SpectatorState:
+    """
+    受信したフレームからゲームの状態を復元するクラス
+    光線は発射時の半径とティックを覚えておき、現在の半径を計算で求める
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.score = 0
+        self.kill_count = 0
+        self.planet_angle = 0.0
+        self.star_angle = 0.0
+        self.cannon_radii = []
+        self.beam_speed = 0.0
+        self.tick_steps = 1
+        self.beams = {} # id -> (発射時の半径, 発射時のティック, 光線の辞書)
+        self.corpses = []
+        self.synced = False # KEYFRAMEを受け取ったか
+
+    def apply(self, message):
+        """
+        フレームを1つ反映する
+        :param message: protocol.decode() の結果
+        """
+        if message['kind'] == KEYFRAME:
+            self.synced = True
+            self.beam_speed = message['beam_speed']
+            self.tick_steps = message['tick_steps']
+            self.beams = {beam['id']: (beam['radius'], message['tick'], beam) for beam in message['beams']}
+            self.corpses = message['corpses']
+        elif not self.synced:
+            return
+        else:
+            for beam_id in message['removed']:
+                self.beams.pop(beam_id, None)
+            for beam in message['spawned']:
+                self.beams[beam['id']] = (beam['radius'], message['tick'], beam)
+            # 手元の死体だけ1ティック分減らす（このフレームで届いた死体の寿命はサーバーでの値そのもの）
+            self.corpses = [c for c in self.corpses if c['life'] > self.tick_steps]
+            for corpse in self.corpses:
+                corpse['life'] -= self.tick_steps
+            self.corpses += message['corpses']
+
+        self.tick = message['tick']
+        self.score = message['score']
+        self.kill_count = message['kill_count']
+        self.planet_angle = message['planet_angle']
+        self.star_angle = message['star_angle']
+        self.cannon_radii = message['cannon_radii']
+
+    def beam_radius(self, beam_id):
+        """光線の現在の半径"""
+        radius, spawn_tick, _ = self.beams[beam_id]
+        return radius + self.beam_speed * (self.tick - spawn_tick)
+
+async def watch(state, host='127.0.0.1', port=8765, unix_path=None, on_frame=None):
+    """
+    サーバーに接続し、受信したフレームを state に反映し続ける
+    :param on_frame: フレームを反映するたびに呼ばれる関数（省略可）
+    """
+    if unix_path is not None:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            header = await reader.readexactly(FRAME_HEADER.size)
+            length, = FRAME_HEADER.unpack(header)
+            state.apply(decode(await reader.readexactly(length)))
+            if on_frame is not None:
+                on_frame(state)
+    except asyncio.IncompleteReadError:
+        pass
+    finally:
+        writer.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ORBITAL SURVIVAL 観戦クライアント")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help="Unixソケットで接続する")
+    args = parser.parse_args(argv)
+
+    def print_status(state):
+        # 1秒（120ティック）に1回、状態を表示する
+        if state.synced and state.tick % 120 == 0:
+            print(f"tick={state.tick:6d} score={state.score:6d} killed={state.kill_count:3d} "
+                  f"beams={len(state.beams):3d} corpses={len(state.corpses):2d}")
+
+    asyncio.run(watch(SpectatorState(), args.host, args.port, args.unix, print_status))
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# spectator/protocol.py
+#
+# 観戦用のバイナリプロトコル（すべてリトルエンディアン）
+#   フレーム     : u32 ペイロード長 + ペイロード
+#   ペイロード   : u8 種別 + 本体
+#   KEYFRAME    : 共通ヘッダ, f32 光線の速度, u8 1ティックのフレーム数, u16 光線数, u16 死体数, 光線*, 死体*
+#   DELTA       : 共通ヘッダ, u16 発射数, u16 消滅数, u16 新しい死体数, 発射*, 消滅(u32 id)*, 死体*
+#   共通ヘッダ   : u32 tick, i32 score, u32 kill_count, f32 惑星角度, f32 恒星角度, f32 砲台半径*3
+#   光線        : u32 id, f32 角度, f32 角度範囲, f32 半径, u8 幅
+#   死体        : f32 角度, f32 角度範囲, f32 半径, u8 幅, u8 残り寿命（フレーム数）
+# 光線は発射後は決定的に広がる（半径 = 発射時の半径 + 速度 * 経過ティック）ので、
+# DELTA では発射と消滅だけを送る
+
+import struct
+
+KEYFRAME = 1
+DELTA = 2
+
+FRAME_HEADER = struct.Struct('<I')
+KIND = struct.Struct('<B')
+STATE_HEADER = struct.Struct('<IiIff3f')
+KEYFRAME_HEADER = struct.Struct('<fBHH')
+DELTA_HEADER = struct.Struct('<HHH')
+BEAM = struct.Struct('<IfffB')
+CORPSE = struct.Struct('<fffBB')
+BEAM_ID = struct.Struct('<I')
+
+def _state_header(play):
+    """共通ヘッダを作る"""
+    return STATE_HEADER.pack(play.tick, play.score, play.kill_count,
+                             play.planet.angle, play.star.angle, *play.star.cannon_radii)
+
+def _beam(beam):
+    return BEAM.pack(beam.id, beam.angle, beam.arc_range, beam.radius, beam.width)
+
+def _corpse(corpse):
+    return CORPSE.pack(corpse.angle, corpse.arc_range, corpse.radius, corpse.width, corpse.life)
+
+def _frame(kind, parts):
+    """種別と本体からフレームを作る"""
+    payload = KIND.pack(kind) + b''.join(parts)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+def encode_keyframe(play, beam_speed, tick_steps):
+    """
+    現在の状態をすべて含むKEYFRAMEを作る
+    :param play: Playオブジェクト
+    :param beam_speed: 光線が1ティックで広がる速さ
+    :param tick_steps: 1ティックのフレーム数（死体の寿命の減り方）
+    """
+    beams = play.star.beams
+    corpses = play.corpses
+    parts = [_state_header(play), KEYFRAME_HEADER.pack(beam_speed, tick_steps, len(beams), len(corpses))]
+    parts.extend(_beam(beam) for beam in beams)
+    parts.extend(_corpse(corpse) for corpse in corpses)
+    return _frame(KEYFRAME, parts)
+
+def encode_delta(play, spawned, removed_ids, new_corpses):
+    """
+    前のティックからの差分を含むDELTAを作る
+    :param play: Playオブジェクト
+    :param spawned: このティックで発射された光線
+    :param removed_ids: このティックで消滅した光線のid
+    :param new_corpses: このティックで生まれた死体
+    """
+    parts = [_state_header(play), DELTA_HEADER.pack(len(spawned), len(removed_ids), len(new_corpses))]
+    parts.extend(_beam(beam) for beam in spawned)
+    parts.extend(BEAM_ID.pack(beam_id) for beam_id in removed_ids)
+    parts.extend(_corpse(corpse) for corpse in new_corpses)
+    return _frame(DELTA, parts)
+
+def decode(payload):
+    """
+    ペイロード（フレーム長を除いた部分）を辞書に戻す
+    光線は {'id', 'angle', 'arc_range', 'radius', 'width'}、死体は {'angle', 'arc_range', 'radius', 'width', 'life'}
+    """
+    kind, = KIND.unpack_from(payload, 0)
+    offset = KIND.size
+    tick, score, kill_count, planet_angle, star_angle, *cannon_radii = STATE_HEADER.unpack_from(payload, offset)
+    offset += STATE_HEADER.size
+    message = {'kind': kind, 'tick': tick, 'score': score, 'kill_count': kill_count,
+               'planet_angle': planet_angle, 'star_angle': star_angle, 'cannon_radii': cannon_radii}
+
+    def read_beams(count):
+        nonlocal offset
+        beams = []
+        for _ in range(count):
+            beam_id, angle, arc_range, radius, width = BEAM.unpack_from(payload, offset)
+            offset += BEAM.size
+            beams.append({'id': beam_id, 'angle': angle, 'arc_range': arc_range, 'radius': radius, 'width': width})
+        return beams
+
+    def read_corpses(count):
+        nonlocal offset
+        corpses = []
+        for _ in range(count):
+            angle, arc_range, radius, width, life = CORPSE.unpack_from(payload, offset)
+            offset += CORPSE.size
+            corpses.append({'angle': angle, 'arc_range': arc_range, 'radius': radius, 'width': width, 'life': life})
+        return corpses
+
+    if kind == KEYFRAME:
+        beam_speed, tick_steps, num_beams, num_corpses = KEYFRAME_HEADER.unpack_from(payload, offset)
+        offset += KEYFRAME_HEADER.size
+        message['beam_speed'] = beam_speed
+        message['tick_steps'] = tick_steps
+        message['beams'] = read_beams(num_beams)
+        message['corpses'] = read_corpses(num_corpses)
+    else:
+        num_spawned, num_removed, num_corpses = DELTA_HEADER.unpack_from(payload, offset)
+        offset += DELTA_HEADER.size
+        message['spawned'] = read_beams(num_spawned)
+        message['removed'] = [BEAM_ID.unpack_from(payload, offset + i * BEAM_ID.size)[0] for i in range(num_removed)]
+        offset += num_removed * BEAM_ID.size
+        message['corpses'] = read_corpses(num_corpses)
+    return message
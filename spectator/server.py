@@ -0,0 +1,183 @@
+# spectator/server.py
+
+import asyncio
+import threading
+
+from config import TICK_STEPS
+from entities.beam import Beam, BeamCorpse
+from spectator.protocol import encode_keyframe, encode_delta
+
+class _Client:
+    """接続中の観戦クライアント"""
+
+    def __init__(self, writer, queue_size):
+        self.writer = writer
+        self.queue = asyncio.Queue(maxsize=queue_size) # 送信待ちのフレーム
+        self.needs_keyframe = True # 次にKEYFRAMEを受け取るまで差分を送らない
+        self.skipped = 0 # 送信が追いつかず捨てたフレームの数
+
+class SpectatorServer:
+    """
+    プレイ中の状態を観戦クライアントに配信するサーバー
+    asyncioのイベントループを別スレッドで動かし、ゲームスレッドはフレームを作って渡すだけで待たない。
+    フレームは1ティックにつき1回だけ作り、全クライアントで同じバイト列を共有する。
+    送信が追いつかないクライアントは溜まったフレームを捨て、次のKEYFRAMEから再開する。
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, unix_path=None, queue_size=240):
+        """
+        SpectatorServerオブジェクトの初期化
+        :param host: 待ち受けるホスト
+        :param port: 待ち受けるポート
+        :param unix_path: 指定した場合はTCPではなくUnixソケットで待ち受ける
+        :param queue_size: クライアントごとの送信待ちフレーム数の上限
+        """
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.queue_size = queue_size
+
+        self._clients = []
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._started = threading.Event()
+        self._start_error = None # 待ち受けの開始に失敗したときの例外（start() で送出し直す）
+
+        # --- ゲームスレッド側の状態 ---
+        self.keyframe_requested = False # 次のpublishでKEYFRAMEを作る
+        self._known_beam_ids = set() # クライアントに送信済みの光線
+        self._last_beam_id = -1
+        self._last_tick = -1
+
+    def start(self, timeout=5.0):
+        """
+        イベントループのスレッドを起動し、待ち受けを開始するまで待つ
+        :param timeout: 待ち受けの開始を待つ最大時間[s]
+        :raises OSError: ポートが使用中などで待ち受けを開始できなかった場合
+        :raises RuntimeError: timeout 秒以内に待ち受けを開始できなかった場合
+        """
+        self._thread = threading.Thread(target=self._run, name="spectator-server", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout):
+            raise RuntimeError(f"spectator server did not start within {timeout}s")
+        if self._start_error is not None:
+            raise self._start_error
+
+    def stop(self):
+        """待ち受けを終了してスレッドを止める"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    def _run(self):
+        """イベントループのスレッド本体"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            if self.unix_path is not None:
+                start = asyncio.start_unix_server(self._handle_client, path=self.unix_path)
+            else:
+                start = asyncio.start_server(self._handle_client, self.host, self.port)
+            self._server = loop.run_until_complete(start)
+            self._loop = loop
+        except Exception as error:
+            # スレッド内の例外はゲームスレッドに届かないので、保存して start() で送出する
+            self._start_error = error
+            loop.close()
+            return
+        finally:
+            self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            for client in self._clients:
+                client.writer.close()
+            self._loop.close()
+
+    # --- ゲームスレッドから呼ぶ ---
+
+    def publish(self, play):
+        """
+        1ティック分の状態を配信する（Play.step の最後に呼ぶ）
+        :param play: Playオブジェクト
+        """
+        if not self._clients:
+            # 観戦者がいなければフレームを作らない（次の接続時にKEYFRAMEから始める）
+            return
+
+        beams = play.star.beams
+        if play.tick < self._last_tick:
+            # 新しいラウンドが始まったので全員をKEYFRAMEからやり直す
+            self.keyframe_requested = True
+            self._loop.call_soon_threadsafe(self._request_keyframe_for_all)
+        self._last_tick = play.tick
+
+        # 発射された光線は id が増え続けるので、末尾から新しいものだけを拾う
+        spawned = []
+        for beam in reversed(beams):
+            if beam.id <= self._last_beam_id:
+                break
+            spawned.append(beam)
+        spawned.reverse()
+        if spawned:
+            self._last_beam_id = spawned[-1].id
+
+        current_ids = {beam.id for beam in beams}
+        removed_ids = self._known_beam_ids - current_ids
+        self._known_beam_ids = current_ids
+        # 死体はこのティックの衝突判定で生まれたものだけがまだ寿命を減らしていない
+        new_corpses = [corpse for corpse in play.corpses if corpse.life == BeamCorpse.DURATION]
+
+        delta = encode_delta(play, spawned, removed_ids, new_corpses)
+        keyframe = None
+        if self.keyframe_requested:
+            self.keyframe_requested = False
+            keyframe = encode_keyframe(play, Beam.SPEED, TICK_STEPS)
+        self._loop.call_soon_threadsafe(self._broadcast, delta, keyframe)
+
+    # --- イベントループのスレッドで実行 ---
+
+    def _broadcast(self, delta, keyframe):
+        """全クライアントの送信待ちにフレームを入れる"""
+        for client in self._clients:
+            if client.needs_keyframe:
+                if keyframe is None:
+                    continue
+                frame = keyframe
+            else:
+                frame = delta
+            try:
+                client.queue.put_nowait(frame)
+                client.needs_keyframe = False
+            except asyncio.QueueFull:
+                # 送信が追いつかないので溜まった分を捨て、KEYFRAMEから再開させる
+                while not client.queue.empty():
+                    client.queue.get_nowait()
+                    client.skipped += 1
+                client.needs_keyframe = True
+            if client.needs_keyframe:
+                # ゲームスレッドと行き違いで要求が消えないよう、待っている間は要求し続ける
+                self.keyframe_requested = True
+
+    def _request_keyframe_for_all(self):
+        """全クライアントにKEYFRAMEからの再開を指示する"""
+        for client in self._clients:
+            client.needs_keyframe = True
+
+    async def _handle_client(self, reader, writer):
+        """クライアント1つ分の送信ループ"""
+        client = _Client(writer, self.queue_size)
+        self._clients.append(client)
+        self.keyframe_requested = True
+        try:
+            while True:
+                frame = await client.queue.get()
+                writer.write(frame)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.remove(client)
+            writer.close()
@@ -0,0 +1,134 @@
+# telemetry/query.py
+# テレメトリストアを集計するツール。列を memmap でチャンクごとに読むので、全体をメモリに載せない
+#   python -m telemetry.query DIR summary
+#   python -m telemetry.query DIR survival --bin 5
+#   python -m telemetry.query DIR cannons
+#   python -m telemetry.query DIR scores --bin 100
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from telemetry.store import TelemetryReader
+
+def summary(reader):
+    """ラウンド数・イベント数などの概要"""
+    return {'runs': reader.rows('runs'), 'events': reader.rows('events'),
+            'next_run_id': reader.index['next_run_id']}
+
+def survival_curve(reader, bin_seconds=5.0):
+    """
+    生存曲線：経過時間 t 以上生き残った（プレイを続けた）ラウンドの割合
+    :param bin_seconds: 時間の刻み[秒]（1ミリ秒以上）
+    :return: [(t[秒], 割合), ...]
+    """
+    bin_ms = int(bin_seconds * 1000)
+    if bin_ms <= 0:
+        raise ValueError(f"survival bin must be at least 1 ms: {bin_seconds!r} s")
+    counts = np.zeros(0, dtype=np.int64)
+    for chunk in reader.chunks('runs', ['elapsed_ms']):
+        chunk_counts = np.bincount(chunk['elapsed_ms'] // bin_ms)
+        counts = _add_counts(counts, chunk_counts)
+    total = counts.sum()
+    if total == 0:
+        return []
+    # t 以上のラウンド数 = 後ろからの累積和
+    alive = counts[::-1].cumsum()[::-1]
+    return [(i * bin_seconds, float(alive[i] / total)) for i in range(len(alive))]
+
+def hit_rate_by_cannon(reader):
+    """
+    砲台ごとの命中率
+    :return: {砲台番号: {'beams': 光線数, 'hits': 命中数, 'hit_rate': 命中率}}
+    """
+    beams = np.zeros(0, dtype=np.int64)
+    hits = np.zeros(0, dtype=np.int64)
+    for chunk in reader.chunks('events', ['cannon', 'hit']):
+        beams = _add_counts(beams, np.bincount(chunk['cannon']))
+        hits = _add_counts(hits, np.bincount(chunk['cannon'], weights=chunk['hit']).astype(np.int64))
+    hits = _add_counts(hits, np.zeros(len(beams), dtype=np.int64))
+    return {cannon: {'beams': int(beams[cannon]), 'hits': int(hits[cannon]),
+                     'hit_rate': float(hits[cannon] / beams[cannon]) if beams[cannon] else 0.0}
+            for cannon in range(len(beams))}
+
+def score_distribution(reader, bin_size=100):
+    """
+    スコアの分布（ヒストグラム）と分位点
+    :param bin_size: スコアの刻み（1以上の整数）
+    :return: {'histogram': [(区間の下限, ラウンド数), ...], 'percentiles': {p: スコア}}
+    """
+    if bin_size < 1:
+        raise ValueError(f"score bin must be a positive integer: {bin_size!r}")
+    # 先に最小値を求めて、負のスコアもbincountできるようにずらす
+    low = None
+    for chunk in reader.chunks('runs', ['score']):
+        if len(chunk['score']):
+            chunk_low = int(chunk['score'].min())
+            low = chunk_low if low is None else min(low, chunk_low)
+    if low is None:
+        return {'histogram': [], 'percentiles': {}}
+    low = (low // bin_size) * bin_size
+
+    counts = np.zeros(0, dtype=np.int64)
+    for chunk in reader.chunks('runs', ['score']):
+        counts = _add_counts(counts, np.bincount((chunk['score'].astype(np.int64) - low) // bin_size))
+
+    # 分位点はヒストグラムから求める（区間の下限で近似）
+    cumulative = counts.cumsum()
+    total = cumulative[-1]
+    percentiles = {p: int(low + np.searchsorted(cumulative, total * p / 100) * bin_size) for p in (10, 50, 90, 99)}
+    histogram = [(int(low + i * bin_size), int(c)) for i, c in enumerate(counts) if c]
+    return {'histogram': histogram, 'percentiles': percentiles}
+
+def _add_counts(total, counts):
+    """長さの違う度数配列を足し合わせる"""
+    if len(counts) > len(total):
+        total, counts = counts.astype(np.int64), total
+    else:
+        total = total.copy()
+    total[:len(counts)] += counts
+    return total
+
+def positive_float(text):
+    """--bin の値を正の有限の数として解析する（argparse の type 用）"""
+    value = float(text)
+    if not 0 < value < float('inf'):
+        raise argparse.ArgumentTypeError(f"must be a positive number: {text!r}")
+    return value
+
+def _check_bin(parser, query, bin_value):
+    """
+    --bin の値が集計の種類に合うかを確かめ、合わなければ parser.error() で終了する
+    （survival は1ミリ秒以上、scores は1以上の整数。それ未満は刻みが0になる）
+    """
+    if bin_value is None:
+        return
+    if query == 'survival' and bin_value < 0.001:
+        parser.error(f"argument --bin: survival needs at least 0.001 s (1 ms): {bin_value!r}")
+    if query == 'scores' and (bin_value < 1 or not bin_value.is_integer()):
+        parser.error(f"argument --bin: scores needs a positive integer: {bin_value!r}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="テレメトリストアの集計")
+    parser.add_argument('directory', help="テレメトリストアのディレクトリ")
+    parser.add_argument('query', choices=('summary', 'survival', 'cannons', 'scores'))
+    parser.add_argument('--bin', type=positive_float, help="survival: 秒の刻み (既定 5), scores: スコアの刻み (既定 100)")
+    args = parser.parse_args(argv)
+    _check_bin(parser, args.query, args.bin)
+
+    reader = TelemetryReader(args.directory)
+    if args.query == 'summary':
+        result = summary(reader)
+    elif args.query == 'survival':
+        result = survival_curve(reader, args.bin or 5.0)
+    elif args.query == 'cannons':
+        result = hit_rate_by_cannon(reader)
+    else:
+        result = score_distribution(reader, int(args.bin or 100))
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# telemetry/sink.py
+
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from telemetry.store import TABLES, load_index, save_index, append_columns, truncate_uncommitted
+
+class TelemetrySink:
+    """
+    ラウンドと光線のイベントをメモリ上の固定長バッファに溜め、バックグラウンドスレッドでまとめて追記するクラス
+    バッファは固定数を使い回すため、メモリ使用量には上限がある。
+    書き出しが追いつかずバッファが尽きたときは、ゲームを止めずにその記録を捨てて数える。
+    """
+
+    def __init__(self, directory, buffer_rows=1 << 16, num_buffers=3, flush_interval=10.0):
+        """
+        TelemetrySinkオブジェクトの初期化
+        :param directory: ストアのディレクトリ（1つのストアに同時に書き込めるのは1プロセスのみ）
+        :param buffer_rows: 1バッファの行数
+        :param num_buffers: テーブルごとのバッファ数
+        :param flush_interval: ラウンド終了時に、前回の書き出しからこの秒数が経っていれば書き出す
+        """
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        self._index = load_index(directory)
+        truncate_uncommitted(directory, self._index)
+
+        # テーブル名 -> 空きバッファ, 書き込み中のバッファと行数
+        self._free = {name: queue.SimpleQueue() for name in TABLES}
+        for name, dtype in TABLES.items():
+            for _ in range(num_buffers):
+                self._free[name].put(np.zeros(buffer_rows, dtype=dtype))
+        self._active = {name: self._free[name].get() for name in TABLES}
+        self._rows = {name: 0 for name in TABLES}
+
+        self.dropped = 0 # バッファが尽きて捨てた記録の数
+        self.current_run_id = None
+
+        self._flush_queue = queue.SimpleQueue() # (テーブル名, バッファ, 行数)
+        self._thread = threading.Thread(target=self._flush_loop, name="telemetry-flush", daemon=True)
+        self._thread.start()
+
+    def begin_run(self):
+        """
+        新しいラウンドを開始し、run_id を割り当てる
+        :return: 割り当てた run_id
+        """
+        self.current_run_id = self._index['next_run_id']
+        self._index['next_run_id'] += 1
+        return self.current_run_id
+
+    def record_event(self, tick, hit, cannon, beam_angle, planet_speed):
+        """
+        光線1本の回避・衝突を記録する
+        :param tick: ラウンド開始からのティック数
+        :param hit: 衝突ならTrue、回避ならFalse
+        :param cannon: 発射した砲台の番号
+        :param beam_angle: 光線の中心角度
+        :param planet_speed: その時点の惑星の角速度
+        """
+        self._append('events', (self.current_run_id, tick, hit, cannon, beam_angle, planet_speed))
+
+    def end_run(self, ticks, elapsed_ms, score, kill_count, dodge_count):
+        """
+        ラウンドの結果を記録する。一定時間ごとに、溜まっている記録を書き出しスレッドに渡す
+        :param ticks: ラウンドのティック数
+        :param elapsed_ms: ラウンドの経過時間[ms]
+        :param score: 最終スコア
+        :param kill_count: 衝突回数
+        :param dodge_count: 回避した光線の数
+        """
+        self._append('runs', (self.current_run_id, ticks, elapsed_ms, score, kill_count, dodge_count))
+        self.current_run_id = None
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _append(self, table, record):
+        """バッファに1行追加し、埋まったら書き出しスレッドに渡す"""
+        buffer = self._active[table]
+        if buffer is None:
+            buffer = self._take_free_buffer(table)
+            if buffer is None:
+                self.dropped += 1
+                return
+        rows = self._rows[table]
+        buffer[rows] = record
+        rows += 1
+        if rows == len(buffer):
+            self._flush_queue.put((table, buffer, rows))
+            buffer = None
+            rows = 0
+        self._active[table] = buffer
+        self._rows[table] = rows
+
+    def _take_free_buffer(self, table):
+        """空きバッファを取り出す（待たない）"""
+        try:
+            return self._free[table].get_nowait()
+        except queue.Empty:
+            return None
+
+    def flush(self):
+        """書き込み中のバッファを書き出しスレッドに渡す（待たない）"""
+        self._last_flush = time.monotonic()
+        for table in TABLES:
+            if self._rows[table] > 0:
+                self._flush_queue.put((table, self._active[table], self._rows[table]))
+                self._active[table] = None
+                self._rows[table] = 0
+
+    def close(self):
+        """残りの記録を書き出してスレッドを終了する"""
+        self.flush()
+        self._flush_queue.put(None)
+        self._thread.join()
+
+    def _flush_loop(self):
+        """書き出しスレッド：列ファイルに追記してから index.json の行数を確定する"""
+        while True:
+            item = self._flush_queue.get()
+            if item is None:
+                return
+            table, buffer, rows = item
+            append_columns(self.directory, table, buffer[:rows])
+            self._index['tables'][table]['rows'] += rows
+            save_index(self.directory, self._index)
+            self._free[table].put(buffer)
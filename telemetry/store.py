@@ -0,0 +1,119 @@
+# telemetry/store.py
+#
+# 追記専用の列指向ストア
+#   DIR/index.json              テーブルごとの確定済み行数・列の型、次のrun_id
+#   DIR/<table>/<column>.bin    列ごとの固定長バイナリ（リトルエンディアン）。追記のみ
+# 読み出し側は index.json の行数までしか読まないので、書き込み途中の行は見えない
+
+import json
+import os
+
+import numpy as np
+
+# 1ラウンド分の記録
+RUN_DTYPE = np.dtype([
+    ('run_id', '<u8'),
+    ('ticks', '<u4'), # ラウンドのティック数
+    ('elapsed_ms', '<u4'), # ラウンドの経過時間
+    ('score', '<i4'),
+    ('kill_count', '<u4'),
+    ('dodge_count', '<u4'),
+])
+
+# 光線1本ごとの記録（回避または衝突）
+EVENT_DTYPE = np.dtype([
+    ('run_id', '<u8'),
+    ('tick', '<u4'), # ラウンド開始からのティック数
+    ('hit', 'u1'), # 1: 衝突, 0: 回避
+    ('cannon', 'u1'), # 発射した砲台の番号
+    ('beam_angle', '<f4'),
+    ('planet_speed', '<f4'),
+])
+
+TABLES = {'runs': RUN_DTYPE, 'events': EVENT_DTYPE}
+
+INDEX_FILE = 'index.json'
+
+def load_index(directory):
+    """
+    index.json を読み込む。なければ空のインデックスを返す
+    :param directory: ストアのディレクトリ
+    """
+    path = os.path.join(directory, INDEX_FILE)
+    if not os.path.exists(path):
+        return {'next_run_id': 0, 'tables': {name: {'rows': 0} for name in TABLES}}
+    with open(path) as f:
+        return json.load(f)
+
+def save_index(directory, index):
+    """index.json を一時ファイル経由で置き換える（読み出し側が壊れた内容を見ないように）"""
+    path = os.path.join(directory, INDEX_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, path)
+
+def column_path(directory, table, column):
+    """列ファイルのパス"""
+    return os.path.join(directory, table, f"{column}.bin")
+
+def append_columns(directory, table, records):
+    """
+    構造化配列を列ごとのファイルに追記する（index.json は更新しない）
+    :param directory: ストアのディレクトリ
+    :param table: テーブル名
+    :param records: TABLES[table] 型の構造化配列
+    """
+    os.makedirs(os.path.join(directory, table), exist_ok=True)
+    for column in records.dtype.names:
+        with open(column_path(directory, table, column), 'ab') as f:
+            f.write(np.ascontiguousarray(records[column]).tobytes())
+
+def truncate_uncommitted(directory, index):
+    """
+    index.json で確定していない行（書き込み途中で終了した分）を列ファイルから切り詰める
+    追記を再開する前に呼び、列どうしの行がずれないようにする
+    """
+    for table, dtype in TABLES.items():
+        rows = index['tables'][table]['rows']
+        for column in dtype.names:
+            path = column_path(directory, table, column)
+            committed = rows * dtype[column].itemsize
+            if os.path.exists(path) and os.path.getsize(path) > committed:
+                os.truncate(path, committed)
+
+class TelemetryReader:
+    """
+    ストアを読み出すクラス。列は np.memmap で開くので、全体をメモリに載せない
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: ストアのディレクトリ
+        """
+        self.directory = directory
+        self.index = load_index(directory)
+
+    def rows(self, table):
+        """確定済みの行数"""
+        return self.index['tables'][table]['rows']
+
+    def column(self, table, column):
+        """
+        列を memmap で開く
+        :return: 確定済みの行数分の読み出し専用配列
+        """
+        rows = self.rows(table)
+        dtype = TABLES[table][column]
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(column_path(self.directory, table, column), dtype=dtype, mode='r', shape=(rows,))
+
+    def chunks(self, table, columns, chunk_rows=1 << 20):
+        """
+        指定した列を chunk_rows 行ずつ切り出して返す
+        :return: 列名 -> 配列 の辞書を順に返すジェネレータ
+        """
+        arrays = {name: self.column(table, name) for name in columns}
+        for start in range(0, self.rows(table), chunk_rows):
+            yield {name: array[start:start + chunk_rows] for name, array in arrays.items()}